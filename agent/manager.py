@@ -8,6 +8,7 @@ import asyncio
 from datetime import datetime
 import json
 import os
+import time
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
@@ -15,19 +16,20 @@ from shared.logging import get_logger
 from shared.db import (
     UserSettings,
     UserTask,
-    create_arxiv_paper,
-    create_paper_analysis,
+    get_or_create_arxiv_papers,
+    create_paper_analyses,
     create_task,
     get_user_settings,
     list_active_queries_for_task,
     update_agent_status,
-    get_arxiv_paper_by_arxiv_id,
     # Integration functions
     get_next_queued_task,
     start_task_processing,
     complete_task_processing,
     create_research_topic_for_user_task,
-    link_analysis_to_user_task,
+    link_analyses_to_user_task,
+    optimize_db,
+    close_db,
 )
 
 from agent.pipeline.pipeline import run_pipeline
@@ -36,6 +38,9 @@ from agent.pipeline.models import PipelineOutput, PipelineTask
 
 logger = get_logger(__name__)
 
+# Refresh SQLite planner statistics this often while the agent is idle
+DB_OPTIMIZE_INTERVAL_SECONDS = 6 * 60 * 60
+
 
 @dataclass
 class RuntimeConfig:
@@ -127,49 +132,54 @@ async def _persist_selected(
     :param topic_id: Research topic ID for legacy compatibility.
     :returns: List of ``(analysis_id, paper_id)`` pairs.
     """
-    saved: List[Tuple[int, int]] = []
+    paper_rows = []
     for s in output.selected:
         c = s.result.candidate
-        # Ensure paper exists
-        existing = await get_arxiv_paper_by_arxiv_id(c.arxiv_id)
-        if existing is None:
-            # Fallbacks for non-arXiv items that may lack timestamps
-            published_ts: datetime = c.published or c.updated or datetime.now()
-            updated_ts: datetime = c.updated or c.published or published_ts
-            paper = await create_arxiv_paper(
-                {
-                    "arxiv_id": c.arxiv_id,
-                    "title": c.title,
-                    "authors": json.dumps([]),  # unknown authors here
-                    "summary": c.summary,
-                    "categories": json.dumps(c.categories or []),
-                    "published": published_ts,
-                    "updated": updated_ts,
-                    "pdf_url": c.pdf_url or "",
-                    "abs_url": c.abs_url or "",
-                    "journal_ref": c.journal_ref,
-                    "doi": c.doi,
-                    "comment": c.comment,
-                    "primary_category": c.primary_category,
-                }
-            )
-        else:
-            paper = existing
-
-        # Create analysis row
-        analysis = await create_paper_analysis(
-            paper_id=paper.id,
-            topic_id=topic_id,
-            relevance=float(s.overall_score),
-            summary=s.result.summary,
-            key_fragments=s.result.key_fragments,
-            contextual_reasoning=s.result.contextual_reasoning,
+        # Fallbacks for non-arXiv items that may lack timestamps
+        published_ts: datetime = c.published or c.updated or datetime.now()
+        updated_ts: datetime = c.updated or c.published or published_ts
+        paper_rows.append(
+            {
+                "arxiv_id": c.arxiv_id,
+                "title": c.title,
+                "authors": json.dumps([]),  # unknown authors here
+                "summary": c.summary,
+                "categories": json.dumps(c.categories or []),
+                "published": published_ts,
+                "updated": updated_ts,
+                "pdf_url": c.pdf_url or "",
+                "abs_url": c.abs_url or "",
+                "journal_ref": c.journal_ref,
+                "doi": c.doi,
+                "comment": c.comment,
+                "primary_category": c.primary_category,
+            }
         )
 
-        # Link analysis to user task through Finding
-        await link_analysis_to_user_task(analysis, user_task)
+    # Ensure papers exist: one lookup and one insert for the whole selection
+    papers = await get_or_create_arxiv_papers(paper_rows)
+
+    # Create analysis rows in a single transaction
+    analyses = await create_paper_analyses(
+        [
+            {
+                "paper_id": papers[s.result.candidate.arxiv_id].id,
+                "topic_id": topic_id,
+                "relevance": float(s.overall_score),
+                "summary": s.result.summary,
+                "status": "analyzed",
+                "key_fragments": s.result.key_fragments,
+                "contextual_reasoning": s.result.contextual_reasoning,
+            }
+            for s in output.selected
+        ]
+    )
+    saved: List[Tuple[int, int]] = [
+        (analysis.id, analysis.paper_id) for analysis in analyses
+    ]
 
-        saved.append((analysis.id, paper.id))
+    # Link all analyses to the user task through Findings in one transaction
+    await link_analyses_to_user_task(analyses, user_task)
     return saved
 
 
@@ -291,31 +301,41 @@ async def main() -> None:
         f"Agent starting (poll={cfg.poll_seconds}s, dry_run={'yes' if cfg.dry_run else 'no'}, agent_id={cfg.agent_id})"
     )
 
-    while True:
-        try:
-            # Get next task from queue (QUEUED status)
-            task = await get_next_queued_task()
-            if not task:
+    last_optimized = time.monotonic()
+    try:
+        while True:
+            try:
+                # Get next task from queue (QUEUED status)
+                task = await get_next_queued_task()
+                if not task:
+                    await update_agent_status(
+                        agent_id=cfg.agent_id,
+                        status="idle",
+                        activity="waiting for queued tasks",
+                    )
+                    now = time.monotonic()
+                    if now - last_optimized >= DB_OPTIMIZE_INTERVAL_SECONDS:
+                        await optimize_db()
+                        last_optimized = now
+                    await asyncio.sleep(cfg.poll_seconds)
+                    continue
+
+                # Process the next queued task
+                logger.info(
+                    f"Processing queued task {task.id}: {task.description[:50]}..."
+                )
+                await _process_user_task(cfg, task)
+
+                # Brief pause between tasks to allow for proper status updates
+                await asyncio.sleep(1)
+
+            except Exception as loop_error:
+                logger.error(f"Agent loop error: {loop_error}")
                 await update_agent_status(
                     agent_id=cfg.agent_id,
-                    status="idle",
-                    activity="waiting for queued tasks",
+                    status="error",
+                    activity=f"error: {str(loop_error)[:100]}",
                 )
-                await asyncio.sleep(cfg.poll_seconds)
-                continue
-
-            # Process the next queued task
-            logger.info(f"Processing queued task {task.id}: {task.description[:50]}...")
-            await _process_user_task(cfg, task)
-
-            # Brief pause between tasks to allow for proper status updates
-            await asyncio.sleep(1)
-
-        except Exception as loop_error:
-            logger.error(f"Agent loop error: {loop_error}")
-            await update_agent_status(
-                agent_id=cfg.agent_id,
-                status="error",
-                activity=f"error: {str(loop_error)[:100]}",
-            )
-            await asyncio.sleep(min(60, cfg.poll_seconds))
+                await asyncio.sleep(min(60, cfg.poll_seconds))
+    finally:
+        await close_db()
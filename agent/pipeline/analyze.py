@@ -25,21 +25,22 @@ from .utils import retry_async
 logger = get_logger(__name__)
 
 
+_ANALYZER_INSTRUCTIONS = dedent("""
+    You are an expert research assistant. Given a paper's title and abstract,
+    assess relevance to the user's task, write a concise summary, and return
+    a percentage relevance.
+
+    Return structured JSON.
+    """)
+
+
 def _get_analyzer():
     """Lazy initialization of the analyzer agent."""
     from agents import Agent
     return Agent(
         name="Paper Analyzer",
         model=get_agent_model(),
-        instructions=dedent(
-            """
-            You are an expert research assistant. Given a paper's title and abstract,
-            assess relevance to the user's task, write a concise summary, and return
-            a percentage relevance.
-
-            Return structured JSON.
-            """
-        ),
+        instructions=_ANALYZER_INSTRUCTIONS,
         output_type=AnalysisAgentOutput,
     )
 
@@ -10,18 +10,19 @@ from shared.logging import get_logger
 logger = get_logger(__name__)
 
 
+_FORMATTER_INSTRUCTIONS = dedent("""
+    Format a set of analyzed papers into short Telegram HTML. Keep it compact.
+    Output JSON with a single field `html` containing the final HTML.
+    """)
+
+
 def _get_formatter():
     """Lazy initialization of the formatter agent."""
     from agents import Agent
     return Agent(
         name="Telegram Formatter",
         model=get_agent_model(),
-        instructions=dedent(
-            """
-            Format a set of analyzed papers into short Telegram HTML. Keep it compact.
-            Output JSON with a single field `html` containing the final HTML.
-            """
-        ),
+        instructions=_FORMATTER_INSTRUCTIONS,
         output_type=TelegramSummary,
     )
 
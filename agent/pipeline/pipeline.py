@@ -42,7 +42,10 @@ async def run_pipeline(task: PipelineTask) -> PipelineOutput:
 
     # Retrieve candidates
     logger.info("Stage: retrieval -> multi-source")
-    candidates = collect_candidates(task, generated_queries, per_query_limit=50)
+    # Source clients are synchronous; keep the event loop free while they run
+    candidates = await asyncio.to_thread(
+        collect_candidates, task, generated_queries, per_query_limit=50
+    )
     logger.info(f"Collected {len(candidates)} unique candidates")
 
     if not candidates:
@@ -57,7 +60,9 @@ async def run_pipeline(task: PipelineTask) -> PipelineOutput:
             logger.warning(
                 f"No candidates found; retrying with broadened queries (n={len(broadened_gq)})"
             )
-            more = collect_candidates(task, broadened_gq, per_query_limit=50)
+            more = await asyncio.to_thread(
+                collect_candidates, task, broadened_gq, per_query_limit=50
+            )
             # Merge
             candidates = more
             logger.info(
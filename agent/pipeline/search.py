@@ -11,7 +11,7 @@ threads or plain sync for now.
 
 from typing import Iterable, List, Optional
 
-from shared.arxiv_parser import ArxivParser
+from shared.arxiv_parser import get_parser
 from shared.logging import get_logger
 from agent.browsing.manual.sources.google_scholar import GoogleScholarBrowser
 from agent.browsing.manual.sources.pubmed import PubMedBrowser
@@ -72,12 +72,14 @@ def arxiv_search(
     logger.debug(
         f"arxiv_search query='{norm_query}' (raw='{query}') categories={categories} start={start} max_results={max_results}"
     )
-    parser = ArxivParser()
-    papers = parser.search_papers(
+    papers = get_parser().search_papers(
         query=norm_query,
         max_results=max_results,
         categories=categories,
         start=start,
+        # Monitoring repeats the same query every cycle; new submissions
+        # must not be hidden behind a cached result
+        use_cache=False,
     )
     candidates: List[PaperCandidate] = []
     for p in papers:
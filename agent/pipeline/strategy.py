@@ -15,28 +15,29 @@ from .utils import retry_async
 logger = get_logger(__name__)
 SourceLiteral = Literal["arxiv", "scholar", "pubmed", "github"]
 
+_STRATEGY_INSTRUCTIONS = dedent("""
+    You turn a user task into a compact set of search queries. For EACH query,
+    you must also choose the most relevant source among: arXiv, Google Scholar,
+    PubMed, GitHub.
+
+    - Prefer concise keyword-style queries
+    - Avoid redundancy between queries
+    - Provide a short rationale per query
+    - If source=arXiv, boolean-style with AND/OR/NOT is welcome; optional category constraints may apply
+    - If source=PubMed, prefer biomedical terms and common synonyms
+    - If source=GitHub, qualifiers like language:Python, stars:>100 are welcome
+    - Keep the set small and high-precision
+    - Output JSON matching the provided schema, including the "source" field per query
+    """)
+
+
 def _get_strategy_agent():
     """Lazy initialization of the strategy agent."""
     from agents import Agent
     return Agent(
         name="Query Strategist",
         model=get_agent_model(),
-        instructions=dedent(
-            """
-            You turn a user task into a compact set of search queries. For EACH query,
-            you must also choose the most relevant source among: arXiv, Google Scholar,
-            PubMed, GitHub.
-
-            - Prefer concise keyword-style queries
-            - Avoid redundancy between queries
-            - Provide a short rationale per query
-            - If source=arXiv, boolean-style with AND/OR/NOT is welcome; optional category constraints may apply
-            - If source=PubMed, prefer biomedical terms and common synonyms
-            - If source=GitHub, qualifiers like language:Python, stars:>100 are welcome
-            - Keep the set small and high-precision
-            - Output JSON matching the provided schema, including the "source" field per query
-            """
-        ),
+        instructions=_STRATEGY_INSTRUCTIONS,
         output_type=QueryPlan,
     )
 
@@ -10,14 +10,7 @@ router = Router(name="general")
 
 logger = get_logger(__name__)
 
-
-@router.message(CommandStart())
-async def command_start_handler(message: Message) -> None:
-    user_name = "user"
-    if message.from_user and message.from_user.full_name:
-        user_name = message.from_user.full_name
-
-    help_text = dedent(f"""
+_START_TEMPLATE = dedent("""
     🔬 Hello, {user_name}! I'm your assistant that explores research sources and finds items useful for your goals.
 
     📌 <b>How it works</b>
@@ -40,14 +33,7 @@ async def command_start_handler(message: Message) -> None:
     Make your task as specific as possible, so I can find the most relevant items for you.
     """)
 
-    await message.answer(help_text, parse_mode=ParseMode.HTML)
-
-
-@router.message(Command("help"))
-async def command_help_handler(message: Message) -> None:
-    """Show help message"""
-
-    help_text = dedent("""
+_HELP_TEXT = dedent("""
     <b>How it works</b>
     1. You create a task, for example: /task "AI for medical imaging"
     2. I search arXiv, Google Scholar, PubMed, and GitHub, evaluate relevance, and send you clear summaries.
@@ -66,7 +52,23 @@ async def command_help_handler(message: Message) -> None:
     Make your task as specific as possible, so I can find the most relevant items for you.
     """)
 
+
+@router.message(CommandStart())
+async def command_start_handler(message: Message) -> None:
+    user_name = "user"
+    if message.from_user and message.from_user.full_name:
+        user_name = message.from_user.full_name
+
+    help_text = _START_TEMPLATE.format(user_name=user_name)
+
+    await message.answer(help_text, parse_mode=ParseMode.HTML)
+
+
+@router.message(Command("help"))
+async def command_help_handler(message: Message) -> None:
+    """Show help message"""
+
     await message.answer(
-        help_text,
+        _HELP_TEXT,
         parse_mode=ParseMode.HTML,
     )
@@ -1,7 +1,7 @@
 from .handlers import router
 from .service import (
     process_completed_task,
-    check_new_analyses,
+    run_notification_pollers,
     send_analysis_report,
     send_message_to_target_chat,
     get_target_chat_id,
@@ -10,7 +10,7 @@ from .service import (
 __all__ = [
     "router",
     "process_completed_task",
-    "check_new_analyses",
+    "run_notification_pollers",
     "send_analysis_report",
     "send_message_to_target_chat",
     "get_target_chat_id",
@@ -1,13 +1,12 @@
-import re
+from typing import Any, Optional, Tuple
 
 from aiogram import Router
 from aiogram.enums import ParseMode
-from aiogram.filters import Command
+from aiogram.filters import Command, CommandObject
 from aiogram.types import Message
 
 from bot.utils import escape_html
 from shared.db import (
-    ensure_connection,
     get_user_settings,
     update_user_settings,
 )
@@ -18,187 +17,181 @@ from .service import simplify_for_layperson
 router = Router(name="notifications")
 logger = get_logger(__name__)
 
+_NO_USER_MSG = "Error: could not determine user."
+_SAVE_ERROR_MSG = "❌ An error occurred while saving settings."
+_RANGE_ERROR_MSG = "❌ Value must be between 0 and 100."
+_INVALID_TYPE_MSG = "❌ Invalid notification type. Use: instant, daily, or weekly."
+_INVALID_NOTIFICATION_MSG = (
+    "❌ <b>Invalid format</b>\n\n"
+    "✅ Correct format:\n"
+    "/set_notification [type] [value]\n\n"
+    "📝 Types: instant, daily, weekly\n"
+    "📊 Value: 0-100 (percentage)\n\n"
+    "💡 Examples:\n"
+    "• /set_notification instant 80\n"
+    "• /set_notification daily 50\n"
+    "• /set_notification weekly 30"
+)
+_GROUP_ONLY_MSG = (
+    "❌ <b>This command can only be used in group chats</b>\n\n"
+    "Add this bot to a group chat and use the command there."
+)
+_GROUP_ALREADY_SET_MSG = "ℹ️ Notifications are already sent to this group chat."
+_GROUP_NOT_CONFIGURED_MSG = (
+    "ℹ️ <b>Group chat not configured</b>\n\n"
+    "Notifications are already being sent to your personal chat."
+)
 
-@router.message(Command("set_notification"))
-async def command_set_notification_handler(message: Message) -> None:
-    """Set notification thresholds."""
-    try:
-        if not message.from_user:
-            await message.answer("Error: could not determine user.")
-            return
+# Notification type -> (UserSettings field, display name)
+_NOTIFICATION_FIELDS = {
+    "instant": ("instant_notification_threshold", "Instant Notification"),
+    "daily": ("daily_digest_threshold", "Daily Digest"),
+    "weekly": ("weekly_digest_threshold", "Weekly Digest"),
+}
 
-        user_id = message.from_user.id
-        command_text = message.text or ""
-
-        pattern = r"/set_notification\s+(\w+)\s+(\d+(?:\.\d+)?)"
-        match = re.search(pattern, command_text)
-
-        if not match:
-            await message.answer(
-                "❌ <b>Invalid format</b>\n\n"
-                "✅ Correct format:\n"
-                "/set_notification [type] [value]\n\n"
-                "📝 Types: instant, daily, weekly\n"
-                "📊 Value: 0-100 (percentage)\n\n"
-                "💡 Examples:\n"
-                "• /set_notification instant 80\n"
-                "• /set_notification daily 50\n"
-                "• /set_notification weekly 30",
-                parse_mode=ParseMode.HTML,
-            )
-            return
 
-        notification_type = match.group(1).lower()
-        value = float(match.group(2))
+def _parse_set_notification(args: Optional[str]) -> Optional[Tuple[str, float]]:
+    """Parse ``/set_notification <type> <value>`` arguments.
 
-        if not (0 <= value <= 100):
-            await message.answer("❌ Value must be between 0 and 100.")
+    :param args: Command arguments as extracted by aiogram.
+    :returns: Tuple of (lowercased type, value) or ``None`` if malformed.
+    """
+    # Two tokens are expected; a third part is enough to reject the input
+    parts = (args or "").split(maxsplit=2)
+    if len(parts) != 2:
+        return None
+    try:
+        return parts[0].lower(), float(parts[1])
+    except ValueError:
+        return None
+
+
+async def _apply_setting(
+    message: Message,
+    command: str,
+    user_id: int,
+    field_name: str,
+    value: Any,
+    headline: str,
+    explanation: str,
+    unchanged_msg: str,
+) -> None:
+    """Store a single user setting and confirm it to the user.
+
+    Shared tail of the notification commands: skips the write when the stored
+    value already matches, otherwise saves it and replies with ``headline``
+    plus a plain-language ``explanation``.
+
+    :param message: Incoming command message to reply to.
+    :param command: Command name used in error logs.
+    :param user_id: Telegram user identifier.
+    :param field_name: ``UserSettings`` column to update.
+    :param value: New value for the column.
+    :param headline: First line of the confirmation reply.
+    :param explanation: Text passed to the simplifier for the reply body.
+    :param unchanged_msg: Reply used when the value is already set.
+    :returns: ``None``.
+    """
+    try:
+        settings = await get_user_settings(user_id)
+        current = None if settings is None else getattr(settings, field_name)
+        if current == value:
+            await message.answer(unchanged_msg, parse_mode=ParseMode.HTML)
             return
 
-        try:
-            ensure_connection()
-        except Exception as conn_error:
-            logger.error(f"Failed to connect to database: {conn_error}")
-            await message.answer("❌ Database connection error. Please try again.")
-            return
+        await update_user_settings(user_id, **{field_name: value})
 
-        try:
-            if notification_type == "instant":
-                await update_user_settings(
-                    user_id, instant_notification_threshold=value
-                )
-                threshold_name = "Instant Notification"
-            elif notification_type == "daily":
-                await update_user_settings(user_id, daily_digest_threshold=value)
-                threshold_name = "Daily Digest"
-            elif notification_type == "weekly":
-                await update_user_settings(user_id, weekly_digest_threshold=value)
-                threshold_name = "Weekly Digest"
-            else:
-                await message.answer(
-                    "❌ Invalid notification type. Use: instant, daily, or weekly."
-                )
-                return
-
-            human = await simplify_for_layperson(
-                f"Notification preference changed: {threshold_name} >= {value:.1f}%"
-            )
-            await message.answer(
-                f"✅ Saved: {threshold_name} = {value:.1f}%\n{escape_html(human)}",
-                parse_mode=ParseMode.HTML,
-            )
-
-            logger.info(
-                f"User {user_id} updated {notification_type} notification threshold to {value}"
-            )
-
-        except Exception as db_error:
-            logger.error(f"Database error in /set_notification: {db_error}")
-            await message.answer("❌ An error occurred while saving settings.")
-
-    except Exception as error:
-        logger.error(f"Error in /set_notification command: {error}")
+        human = await simplify_for_layperson(explanation)
         await message.answer(
-            "❌ An error occurred while setting notification threshold."
+            f"{headline}\n{escape_html(human)}", parse_mode=ParseMode.HTML
         )
+        logger.info(f"User {user_id} set {field_name} from {current} to {value}")
+    except Exception as db_error:
+        logger.error(f"Database error in /{command}: {db_error}")
+        await message.answer(_SAVE_ERROR_MSG)
+
+
+@router.message(Command("set_notification"))
+async def command_set_notification_handler(
+    message: Message, command: CommandObject
+) -> None:
+    """Set notification thresholds."""
+    user = message.from_user
+    if not user:
+        await message.answer(_NO_USER_MSG)
+        return
+
+    parsed = _parse_set_notification(command.args)
+
+    if parsed is None:
+        await message.answer(_INVALID_NOTIFICATION_MSG, parse_mode=ParseMode.HTML)
+        return
+
+    notification_type, value = parsed
+
+    if not (0 <= value <= 100):
+        await message.answer(_RANGE_ERROR_MSG)
+        return
+
+    if notification_type not in _NOTIFICATION_FIELDS:
+        await message.answer(_INVALID_TYPE_MSG)
+        return
+    field_name, threshold_name = _NOTIFICATION_FIELDS[notification_type]
+
+    await _apply_setting(
+        message,
+        "set_notification",
+        user.id,
+        field_name,
+        value,
+        headline=f"✅ Saved: {threshold_name} = {value:.1f}%",
+        explanation=(
+            f"Notification preference changed: {threshold_name} >= {value:.1f}%"
+        ),
+        unchanged_msg=f"ℹ️ {threshold_name} is already {value:.1f}%.",
+    )
 
 
 @router.message(Command("set_group"))
 async def command_set_group_handler(message: Message) -> None:
     """Set group chat for notifications."""
-    try:
-        if not message.from_user:
-            await message.answer("Error: could not determine user.")
-            return
-
-        user_id = message.from_user.id
-        chat_id = message.chat.id
-
-        if message.chat.type not in ["group", "supergroup"]:
-            await message.answer(
-                "❌ <b>This command can only be used in group chats</b>\n\n"
-                "Add this bot to a group chat and use the command there.",
-                parse_mode=ParseMode.HTML,
-            )
-            return
-
-        try:
-            ensure_connection()
-        except Exception as conn_error:
-            logger.error(f"Failed to connect to database: {conn_error}")
-            await message.answer("❌ Database connection error. Please try again.")
-            return
-
-        try:
-            await update_user_settings(user_id, group_chat_id=chat_id)
-            # Re-read to confirm
-            settings = await get_user_settings(user_id)
-            logger.info(
-                f"Confirmed group_chat_id for user {user_id}: {getattr(settings, 'group_chat_id', None)}"
-            )
-            human = await simplify_for_layperson(
-                "Group chat configured for notifications."
-            )
-            await message.answer(
-                f"✅ Group notifications enabled\n{escape_html(human)}",
-                parse_mode=ParseMode.HTML,
-            )
-            logger.info(f"User {user_id} set group chat {chat_id} for notifications")
-        except Exception as db_error:
-            logger.error(f"Database error in /set_group: {db_error}")
-            await message.answer("❌ An error occurred while saving settings.")
-
-    except Exception as error:
-        logger.error(f"Error in /set_group command: {error}")
-        await message.answer("❌ An error occurred while setting group chat.")
+    user = message.from_user
+    if not user:
+        await message.answer(_NO_USER_MSG)
+        return
+
+    chat = message.chat
+    if chat.type not in ("group", "supergroup"):
+        await message.answer(_GROUP_ONLY_MSG, parse_mode=ParseMode.HTML)
+        return
+
+    await _apply_setting(
+        message,
+        "set_group",
+        user.id,
+        "group_chat_id",
+        chat.id,
+        headline="✅ Group notifications enabled",
+        explanation="Group chat configured for notifications.",
+        unchanged_msg=_GROUP_ALREADY_SET_MSG,
+    )
 
 
 @router.message(Command("unset_group"))
 async def command_unset_group_handler(message: Message) -> None:
     """Unset group chat for notifications (return to personal chat)."""
-    try:
-        if not message.from_user:
-            await message.answer("Error: could not determine user.")
-            return
-
-        user_id = message.from_user.id
-
-        try:
-            ensure_connection()
-        except Exception as conn_error:
-            logger.error(f"Failed to connect to database: {conn_error}")
-            await message.answer("❌ Database connection error. Please try again.")
-            return
-
-        try:
-            settings = await get_user_settings(user_id)
-
-            if not (settings and getattr(settings, "group_chat_id", None)):
-                await message.answer(
-                    "ℹ️ <b>Group chat not configured</b>\n\n"
-                    "Notifications are already being sent to your personal chat.",
-                    parse_mode=ParseMode.HTML,
-                )
-                return
-
-            old_group_id = getattr(settings, "group_chat_id", None)
-            await update_user_settings(user_id, group_chat_id=None)
-
-            human = await simplify_for_layperson(
-                "Notifications will now arrive in your personal chat."
-            )
-            await message.answer(
-                f"✅ Back to personal notifications\n{escape_html(human)}",
-                parse_mode=ParseMode.HTML,
-            )
-
-            logger.info(
-                f"User {user_id} unset group chat {old_group_id} for notifications"
-            )
-
-        except Exception:
-            await message.answer("❌ User settings not found.")
-
-    except Exception as error:
-        logger.error(f"Error in /unset_group command: {error}")
-        await message.answer("❌ An error occurred while unsetting group chat.")
+    user = message.from_user
+    if not user:
+        await message.answer(_NO_USER_MSG)
+        return
+
+    await _apply_setting(
+        message,
+        "unset_group",
+        user.id,
+        "group_chat_id",
+        None,
+        headline="✅ Back to personal notifications",
+        explanation="Notifications will now arrive in your personal chat.",
+        unchanged_msg=_GROUP_NOT_CONFIGURED_MSG,
+    )
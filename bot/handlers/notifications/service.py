@@ -1,5 +1,7 @@
 import asyncio
+import heapq
 import json
+import random
 from textwrap import dedent
 from typing import Any
 
@@ -9,18 +11,63 @@ from aiogram.enums import ParseMode
 from shared.llm import get_agent_model
 from bot.utils import escape_html
 from shared.db import (
-    ensure_connection,
     get_analysis_with_entities,
+    get_notification_cursor,
     get_user_settings,
+    list_completed_tasks_since,
     list_new_analyses_since,
     mark_task_sent,
+    mark_tasks_sent_bulk,
     mark_analysis_notified,
+    mark_analyses_notified_bulk,
+    mark_analyses_queued_bulk,
+    mark_analyses_analyzed_bulk,
+    save_notification_cursor,
 )
 from shared.logging import get_logger
 
 
 logger = get_logger(__name__)
 
+_ANALYSES_CURSOR = "analyses"
+_COMPLETED_TASKS_CURSOR = "completed_tasks"
+
+_FACTS_TEMPLATE = (
+    "Title: {title}\n"
+    "Target topic: {target_topic}\n"
+    "Search area: {search_area}\n"
+    "Summary: {summary}\n"
+    "Why relevant (score): {relevance:.1f}%\n"
+    "Link: {link}\n"
+)
+
+# Simplifications currently awaiting the LLM, keyed by input text
+_inflight_simplifications: dict[str, asyncio.Future[str]] = {}
+
+_SIMPLIFIER_INSTRUCTIONS = dedent("""
+    You rewrite technical research notifications into clear, friendly messages for a general audience.
+
+    Goals:
+    - Explain the finding in simple words (what was found and why it matters)
+    - Avoid jargon and numbers unless essential
+    - Keep it short and helpful
+
+    Output format:
+    - 1 short title (no emojis in title)
+    - 1–3 short lines with the essence and usefulness
+    - Final line: a call to action with the link label 'Open on arXiv: <link>'
+
+    Rules:
+    - Use a warm tone, simple vocabulary, and short sentences
+    - No markdown or HTML tags, only plain text
+    - Max length 600 characters total
+    """)
+
+_MONITORING_STARTED_TEXT = (
+    "🤖 <b>Monitoring started!</b>\n\n"
+    "AI agent has begun searching for relevant articles."
+)
+
 
 async def get_target_chat_id(user_id: int) -> int:
     """Return group chat ID if configured, otherwise personal user ID.
@@ -29,7 +76,6 @@ async def get_target_chat_id(user_id: int) -> int:
     :returns: The target chat ID for notifications.
     """
     try:
-        ensure_connection()
         settings = await get_user_settings(user_id)
         current_group = getattr(settings, "group_chat_id", None) if settings else None
         logger.info(
@@ -54,35 +100,35 @@ def _get_simplifier_agent():
     return Agent(
         name="Notification Simplifier",
         model=get_agent_model(),
-        instructions=dedent(
-        """
-        You rewrite technical research notifications into clear, friendly messages for a general audience.
-
-        Goals:
-        - Explain the finding in simple words (what was found and why it matters)
-        - Avoid jargon and numbers unless essential
-        - Keep it short and helpful
-
-        Output format:
-        - 1 short title (no emojis in title)
-        - 1–3 short lines with the essence and usefulness
-        - Final line: a call to action with the link label 'Open on arXiv: <link>'
-
-        Rules:
-        - Use a warm tone, simple vocabulary, and short sentences
-        - No markdown or HTML tags, only plain text
-        - Max length 600 characters total
-        """
-        ),
+        instructions=_SIMPLIFIER_INSTRUCTIONS,
     )
 
 
 async def simplify_for_layperson(text: str) -> str:
     """Return a simplified plain-text version of a notification.
 
+    Concurrent calls with the same input share a single in-flight LLM request.
+
     :param text: Input facts block.
     :returns: Simplified text without markup, friendly to non-technical readers.
     """
+    pending = _inflight_simplifications.get(text)
+    if pending is None:
+        pending = asyncio.ensure_future(_run_simplifier(text))
+        _inflight_simplifications[text] = pending
+        pending.add_done_callback(
+            lambda _: _inflight_simplifications.pop(text, None)
+        )
+    # Shield so that a cancelled caller does not cancel the shared request
+    return await asyncio.shield(pending)
+
+
+async def _run_simplifier(text: str) -> str:
+    """Run the simplifier agent once, falling back to the input on failure.
+
+    :param text: Input facts block.
+    :returns: Simplified text, or ``text`` unchanged if the LLM call fails.
+    """
     try:
         from agents import Runner
         result: Any = await Runner.run(_get_simplifier_agent(), text)
@@ -150,49 +196,33 @@ async def send_message_to_target_chat(
                 )
 
 
-async def send_analysis_report(bot: Bot, user_id: int, analysis_id: int) -> None:
+async def send_analysis_report(
+    bot: Bot, user_id: int, analysis_id: int, *, mark_notified: bool = True
+) -> bool:
     """Send a structured Telegram report for a particular analysis to the target chat.
 
     :param bot: Aiogram bot instance.
     :param user_id: Telegram user identifier.
     :param analysis_id: Identifier of the analysis to render and deliver.
-    :returns: ``None``.
+    :param mark_notified: Mark the analysis as notified right away. Batch callers
+        pass ``False`` and flush the status with a single bulk update instead.
+    :returns: ``True`` if the report was delivered, ``False`` otherwise.
     """
     try:
-        ensure_connection()
         result = await get_analysis_with_entities(analysis_id)
         if not result:
             logger.error(f"Analysis {analysis_id} not found")
-            return
+            return False
         analysis, paper, topic = result
 
-        # We do not surface the date in simplified message; compute defensively for potential future use
-        try:
-            _ = (
-                paper.published.strftime("%d.%m.%Y")
-                if hasattr(paper.published, "strftime")
-                else str(paper.published)
-            )
-        except Exception as date_error:
-            logger.error(f"Error getting published date: {date_error}")
-
-        # Authors are not included in the simplified message; still parse to keep parity and logs healthy
-        try:
-            _authors_list = json.loads(paper.authors)
-        except Exception as authors_error:
-            logger.error(f"Error getting authors: {authors_error}")
-            _authors_list = []
-
         # Prepare human-facing facts and simplify with AI
-        facts = dedent(
-            f"""
-            Title: {paper.title}
-            Target topic: {topic.target_topic}
-            Search area: {topic.search_area}
-            Summary: {analysis.summary or "No summary"}
-            Why relevant (score): {analysis.relevance:.1f}%
-            Link: {paper.abs_url}
-            """
+        facts = _FACTS_TEMPLATE.format(
+            title=paper.title,
+            target_topic=topic.target_topic,
+            search_area=topic.search_area,
+            summary=analysis.summary or "No summary",
+            relevance=analysis.relevance,
+            link=paper.abs_url,
         )
 
         simple_text = await simplify_for_layperson(facts)
@@ -204,18 +234,25 @@ async def send_analysis_report(bot: Bot, user_id: int, analysis_id: int) -> None
             escape_html(simple_text),
             user_id,
         )
-        await mark_analysis_notified(analysis_id)
+        if mark_notified:
+            await mark_analysis_notified(analysis_id)
         logger.info(f"Report sent to chat {target_chat_id} for analysis {analysis_id}")
+        return True
     except Exception as error:
         logger.error(f"Error sending analysis report {analysis_id}: {error}")
+        return False
 
 
-async def process_completed_task(bot: Bot, task: Any) -> None:
+async def process_completed_task(bot: Bot, task: Any, mark_sent: bool = True) -> bool:
     """Process a completed task and send appropriate notifications.
 
     :param bot: Aiogram bot instance.
     :param task: Database task model (completed state) with payload.
-    :returns: ``None``.
+    :param mark_sent: Mark the task as sent right away. Batch callers pass
+        ``False`` and flush the status with a single bulk update instead.
+    :returns: ``True`` if the task is done with (delivered, or skipped because
+        it can never be delivered), ``False`` if delivery failed and should be
+        retried.
     """
     try:
         try:
@@ -228,10 +265,10 @@ async def process_completed_task(bot: Bot, task: Any) -> None:
         user_id = task_data.get("user_id")
 
         if not user_id:
+            # No recipient: retrying can never deliver it
             logger.warning(f"Task {task.id} does not contain user_id")
-            return
+            return True
 
-        ensure_connection()
         target_chat_id = await get_target_chat_id(user_id)
         logger.info(
             f"Sending task {task.id} (type={task_type}) for user {user_id} to chat {target_chat_id}"
@@ -243,16 +280,7 @@ async def process_completed_task(bot: Bot, task: Any) -> None:
                 await send_analysis_report(bot, user_id, analysis_id)
         elif task_type == "monitoring_started":
             await send_message_to_target_chat(
-                bot,
-                target_chat_id,
-                dedent(
-                    """
-                    🤖 <b>Monitoring started!</b>
-
-                    AI agent has begun searching for relevant articles.
-                    """
-                ),
-                user_id,
+                bot, target_chat_id, _MONITORING_STARTED_TEXT, user_id
             )
         elif task_type in ["start_monitoring", "restart_monitoring"]:
             result_text = (
@@ -267,63 +295,218 @@ async def process_completed_task(bot: Bot, task: Any) -> None:
                 bot, target_chat_id, escape_html(str(result)), user_id
             )
 
-        await mark_task_sent(task.id)
+        if mark_sent:
+            await mark_task_sent(task.id)
         logger.info(f"Processed completed task {task.id} of type {task_type}")
+        return True
     except Exception as error:
         logger.error(f"Error processing completed task {task.id}: {error}")
+        return False
+
+
+def _advance_cursor(last_checked_id: int, outcomes: dict[int, bool]) -> int:
+    """Move a cursor through the unbroken run of handled items.
+
+    The cursor stops before the first item that failed, so that item (and
+    any later one still pending) is listed again by the next round, also
+    after a restart. Items already delivered past that point have left the
+    pending status and are not listed again.
+
+    :param last_checked_id: Current cursor.
+    :param outcomes: Item ID mapped to ``True`` if it was delivered or
+        permanently skipped, ``False`` if it should be retried.
+    :returns: The advanced cursor.
+    """
+    for item_id in sorted(outcomes):
+        if not outcomes[item_id]:
+            break
+        last_checked_id = max(last_checked_id, item_id)
+    return last_checked_id
+
 
+async def _poll_new_analyses(bot: Bot, last_checked_id: int) -> int:
+    """Run one round of instant notifications for new analyses.
 
-async def check_new_analyses(bot: Bot) -> None:
-    """Background task to check for new analyses and send instant notifications.
+    Status transitions are batched: all analyses picked up in the round are
+    marked queued with a single UPDATE, the delivered ones are marked
+    notified with another, and failed sends are returned to ``analyzed`` so a
+    later round retries them.
+
+    :param bot: Aiogram bot instance.
+    :param last_checked_id: Highest analysis ID handled so far.
+    :returns: The advanced cursor.
+    """
+    saved_checked_id = last_checked_id
+    analyses = await list_new_analyses_since(last_checked_id, 0.0)
+    pending: list[tuple[int, int]] = []
+    outcomes: dict[int, bool] = {}
+    for analysis in analyses:
+        outcomes[analysis.id] = False
+        try:
+            result = await get_analysis_with_entities(analysis.id)
+            if not result:
+                # Paper or topic is gone; there is nothing to deliver
+                outcomes[analysis.id] = True
+                continue
+            analysis_obj, _paper, topic = result
+            user_id = topic.user_id
+            settings = await get_user_settings(user_id)
+            threshold = getattr(settings, "instant_notification_threshold", 80.0)
+            if analysis_obj.relevance >= float(threshold):  # type: ignore[arg-type]
+                logger.info(
+                    f"Found new high-relevance analysis {analysis_obj.id} for user {user_id}"
+                )
+                pending.append((user_id, analysis_obj.id))
+            else:
+                outcomes[analysis.id] = True
+        except Exception as inner_error:
+            logger.error(
+                f"Error processing analysis {getattr(analysis, 'id', 'unknown')}: {inner_error}"
+            )
+
+    if pending:
+        # Mark as queued to prevent duplicates under race conditions
+        try:
+            await mark_analyses_queued_bulk([analysis_id for _, analysis_id in pending])
+        except Exception as queue_error:
+            logger.error(f"Failed to mark analyses queued: {queue_error}")
+
+        notified: list[int] = []
+        failed: list[int] = []
+        for user_id, analysis_id in pending:
+            if await send_analysis_report(
+                bot, user_id, analysis_id, mark_notified=False
+            ):
+                notified.append(analysis_id)
+                outcomes[analysis_id] = True
+            else:
+                failed.append(analysis_id)
+        # The reports are already out: a failed mark must not hold the cursor
+        # back, or the next round would send them again
+        try:
+            await mark_analyses_notified_bulk(notified)
+        except Exception as notified_error:
+            logger.error(f"Failed to mark analyses notified: {notified_error}")
+        try:
+            await mark_analyses_analyzed_bulk(failed)
+        except Exception as release_error:
+            logger.error(f"Failed to release undelivered analyses: {release_error}")
+
+    last_checked_id = _advance_cursor(last_checked_id, outcomes)
+    if last_checked_id != saved_checked_id:
+        await save_notification_cursor(_ANALYSES_CURSOR, last_checked_id)
+    return last_checked_id
+
+
+async def _poll_completed_tasks(bot: Bot, last_checked_id: int) -> int:
+    """Run one round of delivery for completed legacy tasks.
+
+    :param bot: Aiogram bot instance.
+    :param last_checked_id: Highest task ID handled so far.
+    :returns: The advanced cursor.
+    """
+    saved_checked_id = last_checked_id
+    tasks = await list_completed_tasks_since(last_checked_id)
+    sent: list[int] = []
+    outcomes: dict[int, bool] = {}
+    for task in tasks:
+        outcomes[task.id] = await process_completed_task(bot, task, mark_sent=False)
+        if outcomes[task.id]:
+            sent.append(task.id)
+    # Same as analyses: delivered tasks must not be resent if the mark fails
+    try:
+        await mark_tasks_sent_bulk(sent)
+    except Exception as sent_error:
+        logger.error(f"Failed to mark tasks sent: {sent_error}")
+    last_checked_id = _advance_cursor(last_checked_id, outcomes)
+    if last_checked_id != saved_checked_id:
+        await save_notification_cursor(_COMPLETED_TASKS_CURSOR, last_checked_id)
+    return last_checked_id
+
+
+# (name, cursor, poll round, min interval, max interval, retry delay after an
+# error); on equal due times the earlier entry starts first
+_POLL_JOBS = (
+    ("completed tasks", _COMPLETED_TASKS_CURSOR, _poll_completed_tasks, 0.1, 5.0, 5.0),
+    ("analyses", _ANALYSES_CURSOR, _poll_new_analyses, 10.0, 10.0, 30.0),
+)
+
+# Random extra delay per round so several bot instances do not poll in lockstep
+_POLL_JITTER_SECONDS = 0.05
+
+
+async def run_notification_pollers(bot: Bot) -> None:
+    """Background task delivering completed tasks and new analyses.
+
+    A heap ordered by next due time decides when each job runs; due rounds
+    are started as separate tasks, so a slow analyses round
+    (LLM simplification, Telegram sends) does not hold back completed-task
+    delivery. A job is only rescheduled once its round finishes, so it never
+    overlaps with itself. A round that finds nothing doubles its job's
+    interval up to the maximum, and a round that advances the cursor resets
+    it to the minimum. Cursors are persisted so that a restart resumes from
+    where the previous process stopped.
 
     :param bot: Aiogram bot instance.
     :returns: ``None``.
     """
-    logger.info("Starting background analysis checker")
-    last_checked_id = 0
-    while True:
+    logger.info("Starting background notification pollers")
+    cursors: list[int] = []
+    for name, cursor_name, *_ in _POLL_JOBS:
         try:
-            ensure_connection()
-            analyses = await list_new_analyses_since(last_checked_id, 0.0)
-            for analysis in analyses:
-                try:
-                    result = await get_analysis_with_entities(analysis.id)
-                    if not result:
-                        continue
-                    analysis_obj, _paper, topic = result
-                    user_id = topic.user_id
-                    settings = await get_user_settings(user_id)
-                    threshold = getattr(
-                        settings, "instant_notification_threshold", 80.0
-                    )
-                    if analysis_obj.relevance >= float(threshold):  # type: ignore[arg-type]
-                        if getattr(analysis_obj, "status", "") in {
-                            "queued",
-                            "notified",
-                        }:
-                            last_checked_id = max(last_checked_id, analysis_obj.id)
-                            continue
-                        logger.info(
-                            f"Found new high-relevance analysis {analysis_obj.id} for user {user_id}"
-                        )
-                        # Mark as queued to prevent duplicates under race conditions
-                        try:
-                            from shared.db import (
-                                mark_analysis_queued,
-                            )  # local import to avoid cycles
-
-                            await mark_analysis_queued(analysis_obj.id)
-                        except Exception as queue_error:
-                            logger.error(
-                                f"Failed to mark analysis queued: {queue_error}"
-                            )
-                        await send_analysis_report(bot, user_id, analysis_obj.id)
-                    last_checked_id = max(last_checked_id, analysis_obj.id)
-                except Exception as inner_error:
-                    logger.error(
-                        f"Error processing analysis {getattr(analysis, 'id', 'unknown')}: {inner_error}"
-                    )
-            await asyncio.sleep(10)
+            cursors.append(await get_notification_cursor(cursor_name))
+        except Exception as cursor_error:
+            logger.error(f"Failed to load {name} cursor: {cursor_error}")
+            cursors.append(0)
+
+    intervals = [job[3] for job in _POLL_JOBS]
+    loop = asyncio.get_running_loop()
+    schedule = [(loop.time(), index) for index in range(len(_POLL_JOBS))]
+    heapq.heapify(schedule)
+    rescheduled = asyncio.Event()
+    running: dict[int, asyncio.Task[None]] = {}
+
+    async def run_round(index: int) -> None:
+        job = _POLL_JOBS[index]
+        name, _cursor_name, poll, min_interval, max_interval, retry_delay = job
+        next_delay = retry_delay
+        try:
+            last_checked_id = await poll(bot, cursors[index])
+            if last_checked_id != cursors[index]:
+                intervals[index] = min_interval
+            else:
+                intervals[index] = min(intervals[index] * 2, max_interval)
+            cursors[index] = last_checked_id
+            next_delay = intervals[index] + random.uniform(0, _POLL_JITTER_SECONDS)
         except Exception as loop_error:
-            logger.error(f"Error in background analysis checker: {loop_error}")
-            await asyncio.sleep(30)
+            logger.error(f"Error in background {name} poller: {loop_error}")
+        finally:
+            heapq.heappush(schedule, (loop.time() + next_delay, index))
+            rescheduled.set()
+
+    try:
+        while True:
+            if not schedule:
+                rescheduled.clear()
+                await rescheduled.wait()
+                continue
+            due, index = schedule[0]
+            delay = due - loop.time()
+            if delay > 0:
+                # Wake up early if a finished round schedules an earlier one
+                rescheduled.clear()
+                try:
+                    await asyncio.wait_for(rescheduled.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(schedule)
+            if index in running:
+                continue
+            task = asyncio.create_task(run_round(index))
+            running[index] = task
+            task.add_done_callback(lambda _task, i=index: running.pop(i, None))
+    finally:
+        for task in running.values():
+            task.cancel()
@@ -11,20 +11,27 @@ from aiogram.types import (
 from aiogram.enums import ParseMode
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
+import asyncio
 import re
 from textwrap import dedent
 from datetime import datetime
+from enum import Enum
+from typing import Optional
 
 from bot.utils import cut_text, escape_html
 from shared.db import (
     get_or_create_user,
-    get_user_tasks,
+    get_user_task,
+    list_recent_user_tasks,
+    count_user_tasks_by_status,
+    count_user_active_tasks,
     create_user_task_with_queue,
     check_user_can_create_task,
     check_rate_limit,
     get_or_create_task_statistics,
     list_recent_analyses_for_user,
     update_queue_positions,
+    User,
     UserPlan,
     TaskStatus,
     # Integration functions
@@ -36,6 +43,149 @@ from shared.logging import get_logger
 router = Router(name="tasks")
 logger = get_logger(__name__)
 
+_TASK_QUOTED_RE = re.compile(r"/task\s+\"([^\"]+)\"\s*(.*)$", re.DOTALL)
+_TASK_PLAIN_RE = re.compile(r"/task\s+(.+)$", re.DOTALL)
+
+_TASK_CREATED_TEMPLATE = dedent("""
+    ✅ <b>Task #{task_id} created successfully!</b>
+
+    📝 <b>Description:</b> {description}
+
+    📊 <b>Your Plan:</b> {plan}
+    🎯 <b>Max Cycles:</b> {max_cycles}
+
+    📍 <b>Queue Position:</b> #{queue_position}
+    📈 <b>Task Slots Left:</b> {slots_left}/{concurrent_limit}
+    ⏱️ <b>Estimated Start:</b> {estimated_time}
+
+    🏃‍♂️ <b>Daily Tasks:</b> {daily_created}/{daily_limit}
+
+    Use /status to check your tasks progress.
+    """)
+
+_NEW_TASK_PROMPT_TEMPLATE = dedent("""
+    📝 <b>Create New Task</b>
+
+    👋 Hi! Please send me the description for your research task.
+
+    📊 <b>Your Plan:</b> {plan}
+    🎯 <b>Max Cycles:</b> {max_cycles}
+    🏃‍♂️ <b>Daily Tasks:</b> {daily_created}/{daily_limit}
+    📈 <b>Concurrent Slots:</b> {concurrent_limit}
+
+    <b>Examples:</b>
+    • "Latest advances in quantum computing"
+    • "Machine learning applications in healthcare"
+    • "Sustainable energy storage technologies"
+
+    <i>Your description should be 5-1000 characters long.</i>
+    """)
+
+_STATUS_NO_TASKS_TEMPLATE = dedent("""
+    ⚠️ <b>No tasks found!</b>
+
+    📊 <b>Your Plan:</b> {plan}
+    🏃‍♂️ <b>Daily Tasks:</b> {daily_created}/{daily_limit}
+    📈 <b>Concurrent Slots:</b> {concurrent_limit}
+
+    To create a new task, use:
+    <code>/task "your research description"</code>
+
+    Or simply type <code>/task</code> for interactive mode.
+    """)
+
+_STATUS_HEADER_TEMPLATE = dedent("""
+    📊 <b>Task Status Dashboard</b>
+
+    👤 <b>User:</b> {user_name} ({plan})
+    🏃‍♂️ <b>Daily Usage:</b> {daily_created}/{daily_limit}
+    📈 <b>Active Slots:</b> {active_count}/{concurrent_limit}
+    """)
+
+_STATUS_FOOTER = dedent("""
+
+    📚 <b>Commands:</b>
+    /history - View task results
+    /task - Create new task
+    """)
+
+_HISTORY_NO_TASKS_TEXT = dedent("""
+    ⚠️ <b>No tasks found!</b>
+
+    Create your first task to see results here:
+    <code>/task "your research description"</code>
+    """)
+
+_HISTORY_NO_COMPLETED_TEXT = dedent("""
+    ⚠️ <b>No completed tasks found!</b>
+
+    Your tasks are still processing or haven't started yet.
+    Use /status to check current progress.
+    """)
+
+_HISTORY_TEMPLATE = dedent("""
+    📚 <b>Task History</b>
+
+    Select a task to view its detailed results:
+
+    📊 <b>Your Stats:</b>
+    • Total tasks: {total}
+    • Completed: {completed}
+    • Processing: {processing}
+    • Failed: {failed}
+    """)
+
+_TASK_DETAILS_TEMPLATE = dedent("""
+    📋 <b>Task #{task_id} Details</b>
+
+    📝 <b>Description:</b> {description}
+    📊 <b>Status:</b> {status_emoji} {status}
+    🔄 <b>Cycles:</b> {cycles_completed}/{max_cycles}
+
+    ⏰ <b>Created:</b> {created_at}
+    """)
+
+_NO_ANALYSES_TEXT = dedent("""
+    📊 <b>Recent Analysis Results</b>
+
+    ⚠️ No analysis results found yet.
+
+    Results will appear here as your tasks complete their research cycles.
+    """)
+
+_CANCEL_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="❌ Cancel", callback_data="cancel_task_creation")]
+    ]
+)
+_BACK_TO_LIST_BUTTON = InlineKeyboardButton(
+    text="🔙 Back to Task List", callback_data="history_back"
+)
+_BACK_TO_LIST_KEYBOARD = InlineKeyboardMarkup(inline_keyboard=[[_BACK_TO_LIST_BUTTON]])
+_BACK_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="🔙 Back", callback_data="history_back")]
+    ]
+)
+_RECENT_ANALYSES_BUTTON = InlineKeyboardButton(
+    text="📊 Recent Analyses (All Tasks)", callback_data="history_recent_all"
+)
+
+_STATUS_EMOJI: dict[str, str] = {
+    "queued": "⏳",
+    "processing": "🔄",
+    "completed": "✅",
+    "failed": "❌",
+    "cancelled": "🚫",
+    "paused": "⏸️",
+    "active": "🔄",
+}
+
+# Statuses that occupy one of the user's concurrent task slots
+_ACTIVE_STATUSES = (TaskStatus.QUEUED, TaskStatus.PROCESSING)
+# Statuses listed in /history
+_HISTORY_STATUSES = (TaskStatus.COMPLETED, TaskStatus.PROCESSING, TaskStatus.FAILED)
+
 
 class TaskCreationStates(StatesGroup):
     """States for task creation flow."""
@@ -74,32 +224,105 @@ def get_status_emoji(status) -> str:
     :param status: Task status (enum or string)
     :returns: Emoji string
     """
-    # Handle enum by getting its value
-    if hasattr(status, "value"):
-        status_str = status.value.lower()
-    else:
-        status_str = str(status).lower()
+    # Rows loaded from the database carry the plain lowercase value
+    emoji = _STATUS_EMOJI.get(status)
+    if emoji is not None:
+        return emoji
+    status_str = status.value if isinstance(status, Enum) else str(status)
+    return _STATUS_EMOJI.get(status_str.lower(), "❓")
+
+
+# Minimum seconds between two queue position refreshes; /task requests that
+# arrive in between share the next refresh
+QUEUE_REFRESH_INTERVAL_SECONDS = 0.5
+_queue_refresh_requested = asyncio.Event()
+_queue_refresh_worker: Optional[asyncio.Task] = None
+
+
+async def _queue_refresh_loop() -> None:
+    """Run ``update_queue_positions`` at most once per interval while requested."""
+    while True:
+        await _queue_refresh_requested.wait()
+        _queue_refresh_requested.clear()
+        try:
+            await update_queue_positions()
+        except Exception as error:
+            logger.error(f"Error refreshing queue positions: {error}")
+        await asyncio.sleep(QUEUE_REFRESH_INTERVAL_SECONDS)
+
+
+def request_queue_refresh() -> None:
+    """Schedule a coalesced queue position refresh.
+
+    Starts the refresh worker on first use, so no wiring in the bot bootstrap
+    is needed.
+    """
+    global _queue_refresh_worker
+    _queue_refresh_requested.set()
+    if _queue_refresh_worker is None or _queue_refresh_worker.done():
+        _queue_refresh_worker = asyncio.create_task(_queue_refresh_loop())
+
+
+def _format_active_task(task, now: datetime) -> str:
+    """Format one active task entry of the /status dashboard.
+
+    :param task: UserTask instance with ``queue_entry`` eager-loaded
+    :param now: Reference time for the estimated start
+    :returns: HTML block for the task, ending with a blank line
+    """
+    lines = [
+        f"{get_status_emoji(task.status)} <b>#{task.id}</b> "
+        f"{escape_html(cut_text(task.description, 40))}",
+        f"   Cycles: {task.cycles_completed}/{task.max_cycles} | Status: {task.status}",
+    ]
+
+    # queue_entry is eager-loaded by list_recent_user_tasks
+    queue_entry = task.queue_entry
+    if queue_entry is not None:
+        if queue_entry.queue_position:
+            lines.append(f"   Queue position: #{queue_entry.queue_position}")
+        if queue_entry.estimated_start_time:
+            est_time = queue_entry.estimated_start_time - now
+            if est_time.total_seconds() > 0:
+                lines.append(
+                    f"   Est. start: {format_time_estimate(est_time.total_seconds())}"
+                )
+            else:
+                lines.append("   Est. start: Now")
+    return "\n".join(lines) + "\n\n"
+
+
+def _parse_callback_task_id(data: Optional[str]) -> Optional[int]:
+    """Extract the task ID from callback data such as ``history_task_12``.
+
+    :param data: Raw callback data
+    :returns: Task ID or None if the data does not end in a plausible ID
+    """
+    tail = (data or "").rpartition("_")[2]
+    # Task IDs are auto-increment integers; reject oversized or signed input
+    if not (tail.isascii() and tail.isdigit()) or len(tail) > 10:
+        return None
+    return int(tail)
+
 
-    return {
-        "queued": "⏳",
-        "processing": "🔄",
-        "completed": "✅",
-        "failed": "❌",
-        "cancelled": "🚫",
-        "paused": "⏸️",
-        "active": "🔄",
-    }.get(status_str, "❓")
+def _count_active(counts: dict[TaskStatus, int]) -> int:
+    """Sum the tasks that occupy concurrent slots.
 
+    :param counts: Per-status task counts
+    :returns: Number of queued and processing tasks
+    """
+    return sum(counts.get(status, 0) for status in _ACTIVE_STATUSES)
 
-async def rate_limit_check(message: Message, action_type: str) -> bool:
+
+async def rate_limit_check(message: Message, action_type: str) -> Optional[User]:
     """Check rate limits for user action and send error message if exceeded.
 
     :param message: Telegram message
     :param action_type: Type of action being performed
-    :returns: True if allowed, False if rate limited
+    :returns: The resolved user if allowed, None if rate limited
     """
     if not message.from_user:
-        return False
+        return None
 
     user = await get_or_create_user(message.from_user.id)
     allowed, reason = await check_rate_limit(user.id, action_type)
@@ -111,8 +334,9 @@ async def rate_limit_check(message: Message, action_type: str) -> bool:
             parse_mode=ParseMode.HTML,
         )
         logger.warning(f"Rate limit exceeded for user {user.telegram_id}: {reason}")
+        return None
 
-    return allowed
+    return user
 
 
 @router.message(Command("task"))
@@ -137,7 +361,7 @@ async def command_create_task(message: Message, state: FSMContext) -> None:
         text = message.text or ""
 
         # Check if description is provided directly
-        m = re.match(r"/task\s+\"([^\"]+)\"\s*(.*)$", text, re.DOTALL)
+        m = _TASK_QUOTED_RE.match(text)
         if m:
             # Direct task creation with description in quotes
             description = m.group(1).strip()
@@ -145,7 +369,7 @@ async def command_create_task(message: Message, state: FSMContext) -> None:
             return
 
         # Check for description without quotes
-        m = re.match(r"/task\s+(.+)$", text, re.DOTALL)
+        m = _TASK_PLAIN_RE.match(text)
         if m:
             # Direct task creation with description (no quotes)
             description = m.group(1).strip()
@@ -197,13 +421,14 @@ async def create_task_for_user(user, description: str, message: Message) -> None
         # Create task and add to queue
         task, queue_entry = await create_user_task_with_queue(user, description)
 
-        # Get statistics for estimates
-        stats = await get_or_create_task_statistics()
+        # Queue positions of other tasks are bookkeeping the reply does not
+        # depend on; refreshes are coalesced across concurrent /task calls
+        request_queue_refresh()
 
-        # Calculate remaining slots
-        user_tasks = await get_user_tasks(user.id)
-        active_tasks = len(
-            [t for t in user_tasks if str(t.status) in ["queued", "processing"]]
+        # Statistics for estimates and task counts for remaining slots
+        stats, active_tasks = await asyncio.gather(
+            get_or_create_task_statistics(),
+            count_user_active_tasks(user.id),
         )
         slots_left = user.concurrent_task_limit - active_tasks
 
@@ -212,27 +437,18 @@ async def create_task_for_user(user, description: str, message: Message) -> None
             stats.median_processing_time * queue_entry.queue_position
         )
 
-        # Update queue positions
-        await update_queue_positions()
-
         await message.answer(
-            dedent(
-                f"""
-                ✅ <b>Task #{task.id} created successfully!</b>
-                
-                📝 <b>Description:</b> {escape_html(cut_text(description, 200))}
-                
-                📊 <b>Your Plan:</b> {get_plan_display_name(user.plan)}
-                🎯 <b>Max Cycles:</b> {task.max_cycles}
-                
-                📍 <b>Queue Position:</b> #{queue_entry.queue_position}
-                📈 <b>Task Slots Left:</b> {slots_left}/{user.concurrent_task_limit}
-                ⏱️ <b>Estimated Start:</b> {estimated_time}
-                
-                🏃‍♂️ <b>Daily Tasks:</b> {user.daily_tasks_created}/{user.daily_task_limit}
-                
-                Use /status to check your tasks progress.
-                """
+            _TASK_CREATED_TEMPLATE.format(
+                task_id=task.id,
+                description=escape_html(cut_text(description, 200)),
+                plan=get_plan_display_name(user.plan),
+                max_cycles=task.max_cycles,
+                queue_position=queue_entry.queue_position,
+                slots_left=slots_left,
+                concurrent_limit=user.concurrent_task_limit,
+                estimated_time=estimated_time,
+                daily_created=user.daily_tasks_created,
+                daily_limit=user.daily_task_limit,
             ),
             parse_mode=ParseMode.HTML,
         )
@@ -264,38 +480,15 @@ async def start_interactive_task_creation(
         )
         return
 
-    # Create cancel keyboard
-    keyboard = InlineKeyboardMarkup(
-        inline_keyboard=[
-            [
-                InlineKeyboardButton(
-                    text="❌ Cancel", callback_data="cancel_task_creation"
-                )
-            ]
-        ]
-    )
-
     await message.answer(
-        dedent(
-            f"""
-            📝 <b>Create New Task</b>
-            
-            👋 Hi! Please send me the description for your research task.
-            
-            📊 <b>Your Plan:</b> {get_plan_display_name(user.plan)}
-            🎯 <b>Max Cycles:</b> {100 if user.plan == UserPlan.PREMIUM else 5}
-            🏃‍♂️ <b>Daily Tasks:</b> {user.daily_tasks_created}/{user.daily_task_limit}
-            📈 <b>Concurrent Slots:</b> {user.concurrent_task_limit}
-            
-            <b>Examples:</b>
-            • "Latest advances in quantum computing"
-            • "Machine learning applications in healthcare"
-            • "Sustainable energy storage technologies"
-            
-            <i>Your description should be 5-1000 characters long.</i>
-            """
+        _NEW_TASK_PROMPT_TEMPLATE.format(
+            plan=get_plan_display_name(user.plan),
+            max_cycles=100 if user.plan == UserPlan.PREMIUM else 5,
+            daily_created=user.daily_tasks_created,
+            daily_limit=user.daily_task_limit,
+            concurrent_limit=user.concurrent_task_limit,
         ),
-        reply_markup=keyboard,
+        reply_markup=_CANCEL_KEYBOARD,
         parse_mode=ParseMode.HTML,
     )
 
@@ -338,131 +531,120 @@ async def command_status_handler(message: Message) -> None:
             await message.answer("❌ Error: could not determine user.")
             return
 
-        # Rate limiting check
-        if not await rate_limit_check(message, "command"):
+        # Rate limiting check; resolves the user as well
+        user = await rate_limit_check(message, "command")
+        if user is None:
             return
+        counts = await count_user_tasks_by_status(user.id)
 
-        user = await get_or_create_user(message.from_user.id)
-        user_tasks = await get_user_tasks(user.id)
-
-        if not user_tasks:
+        if not counts:
             await message.answer(
-                dedent(
-                    f"""
-                    ⚠️ <b>No tasks found!</b>
-                    
-                    📊 <b>Your Plan:</b> {get_plan_display_name(user.plan)}
-                    🏃‍♂️ <b>Daily Tasks:</b> {user.daily_tasks_created}/{user.daily_task_limit}
-                    📈 <b>Concurrent Slots:</b> {user.concurrent_task_limit}
-                    
-                    To create a new task, use:
-                    <code>/task "your research description"</code>
-                    
-                    Or simply type <code>/task</code> for interactive mode.
-                    """
+                _STATUS_NO_TASKS_TEMPLATE.format(
+                    plan=get_plan_display_name(user.plan),
+                    daily_created=user.daily_tasks_created,
+                    daily_limit=user.daily_task_limit,
+                    concurrent_limit=user.concurrent_task_limit,
                 ),
                 parse_mode=ParseMode.HTML,
             )
             return
 
-        # Group tasks by status
-        active_tasks = [
-            t
-            for t in user_tasks
-            if t.status in [TaskStatus.QUEUED, TaskStatus.PROCESSING]
-        ]
-        completed_tasks = [t for t in user_tasks if t.status == TaskStatus.COMPLETED]
-        failed_tasks = [t for t in user_tasks if t.status == TaskStatus.FAILED]
-        other_tasks = [
-            t
-            for t in user_tasks
-            if t.status
-            not in [
-                TaskStatus.QUEUED,
-                TaskStatus.PROCESSING,
-                TaskStatus.COMPLETED,
-                TaskStatus.FAILED,
-            ]
-        ]
-
-        status_text = dedent(
-            f"""
-            📊 <b>Task Status Dashboard</b>
-            
-            👤 <b>User:</b> {escape_html(user.first_name or "User")} ({get_plan_display_name(user.plan)})
-            🏃‍♂️ <b>Daily Usage:</b> {user.daily_tasks_created}/{user.daily_task_limit}
-            📈 <b>Active Slots:</b> {len(active_tasks)}/{user.concurrent_task_limit}
-            """
+        # Per-status counts come from SQL; only the rows shown are loaded
+        active_count = _count_active(counts)
+        completed_count = counts.get(TaskStatus.COMPLETED, 0)
+        failed_count = counts.get(TaskStatus.FAILED, 0)
+        other_count = (
+            sum(counts.values()) - active_count - completed_count - failed_count
         )
+        active_tasks, recent_completed = await asyncio.gather(
+            list_recent_user_tasks(user.id, _ACTIVE_STATUSES, limit=5),
+            list_recent_user_tasks(user.id, (TaskStatus.COMPLETED,), limit=3),
+        )
+
+        status_parts: list[str] = [
+            _STATUS_HEADER_TEMPLATE.format(
+                user_name=escape_html(user.first_name or "User"),
+                plan=get_plan_display_name(user.plan),
+                daily_created=user.daily_tasks_created,
+                daily_limit=user.daily_task_limit,
+                active_count=active_count,
+                concurrent_limit=user.concurrent_task_limit,
+            )
+        ]
 
         # Show active tasks
         if active_tasks:
-            status_text += "\n🔄 <b>Active Tasks:</b>\n"
-            for task in active_tasks[:5]:  # Show max 5 active tasks
-                emoji = get_status_emoji(task.status)
-                cycles = f"{task.cycles_completed}/{task.max_cycles}"
-                status_text += f"{emoji} <b>#{task.id}</b> {escape_html(cut_text(task.description, 40))}\n"
-                status_text += f"   Cycles: {cycles} | Status: {task.status}\n"
-
-                # Show queue information if available through eager loading
-                if hasattr(task, "queue_entry") and task.queue_entry:
-                    try:
-                        if task.queue_entry.queue_position:
-                            status_text += f"   Queue position: #{task.queue_entry.queue_position}\n"
-                        if task.queue_entry.estimated_start_time:
-                            est_time = (
-                                task.queue_entry.estimated_start_time - datetime.now()
-                            )
-                            if est_time.total_seconds() > 0:
-                                status_text += f"   Est. start: {format_time_estimate(est_time.total_seconds())}\n"
-                            else:
-                                status_text += "   Est. start: Now\n"
-                    except Exception:
-                        # Skip queue info if not available
-                        pass
-                status_text += "\n"
+            now = datetime.now()
+            status_parts.append("\n🔄 <b>Active Tasks:</b>\n")
+            status_parts.extend(_format_active_task(task, now) for task in active_tasks)
 
         # Show completed tasks summary
-        if completed_tasks:
-            recent_completed = sorted(
-                completed_tasks,
-                key=lambda t: t.updated_at or datetime.now(),
-                reverse=True,
-            )[:3]
-            status_text += (
-                f"\n✅ <b>Recent Completed ({len(completed_tasks)} total):</b>\n"
+        if recent_completed:
+            status_parts.append(
+                f"\n✅ <b>Recent Completed ({completed_count} total):</b>\n"
+            )
+            status_parts.extend(
+                f"✅ <b>#{task.id}</b> {escape_html(cut_text(task.description, 40))}\n"
+                f"   Cycles: {task.cycles_completed}/{task.max_cycles}\n\n"
+                for task in recent_completed
             )
-            for task in recent_completed:
-                status_text += f"✅ <b>#{task.id}</b> {escape_html(cut_text(task.description, 40))}\n"
-                status_text += (
-                    f"   Cycles: {task.cycles_completed}/{task.max_cycles}\n\n"
-                )
 
         # Show failed tasks if any
-        if failed_tasks:
-            status_text += f"\n❌ <b>Failed Tasks:</b> {len(failed_tasks)}\n"
+        if failed_count:
+            status_parts.append(f"\n❌ <b>Failed Tasks:</b> {failed_count}\n")
 
         # Show other tasks if any
-        if other_tasks:
-            status_text += f"\n⏸️ <b>Other Tasks:</b> {len(other_tasks)}\n"
+        if other_count:
+            status_parts.append(f"\n⏸️ <b>Other Tasks:</b> {other_count}\n")
 
         # Add footer with commands
-        status_text += dedent(
-            """
-            
-            📚 <b>Commands:</b>
-            /history - View task results
-            /task - Create new task
-            """
-        )
+        status_parts.append(_STATUS_FOOTER)
 
-        await message.answer(status_text, parse_mode=ParseMode.HTML)
+        await message.answer("".join(status_parts), parse_mode=ParseMode.HTML)
 
     except Exception as e:
         logger.error(f"Error in /status command: {e}")
         await message.answer("❌ An error occurred while getting status.")
 
 
+async def build_history_view(user: User) -> tuple[str, Optional[InlineKeyboardMarkup]]:
+    """Build the /history task list for a user.
+
+    :param user: User instance
+    :returns: Tuple of (HTML text, task selection keyboard or None when there
+        is nothing to select)
+    """
+    counts = await count_user_tasks_by_status(user.id)
+    if not counts:
+        return _HISTORY_NO_TASKS_TEXT, None
+
+    # Tasks that have completed or are active, max 10 for the keyboard
+    relevant_tasks = await list_recent_user_tasks(user.id, _HISTORY_STATUSES, limit=10)
+    if not relevant_tasks:
+        return _HISTORY_NO_COMPLETED_TEXT, None
+
+    # Create task selection keyboard
+    keyboard_buttons = []
+    for task in relevant_tasks:
+        emoji = get_status_emoji(task.status)
+        button_text = f"{emoji} #{task.id}: {cut_text(task.description, 25)}"
+        callback_data = f"history_task_{task.id}"
+        keyboard_buttons.append(
+            [InlineKeyboardButton(text=button_text, callback_data=callback_data)]
+        )
+
+    # Add recent analyses option
+    keyboard_buttons.append([_RECENT_ANALYSES_BUTTON])
+
+    text = _HISTORY_TEMPLATE.format(
+        total=sum(counts.values()),
+        completed=counts.get(TaskStatus.COMPLETED, 0),
+        processing=counts.get(TaskStatus.PROCESSING, 0),
+        failed=counts.get(TaskStatus.FAILED, 0),
+    )
+    return text, InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
+
+
 @router.message(Command("history"))
 async def command_history_handler(message: Message) -> None:
     """Show task history with selection and pagination."""
@@ -471,88 +653,13 @@ async def command_history_handler(message: Message) -> None:
             await message.answer("❌ Error: could not determine user.")
             return
 
-        # Rate limiting check
-        if not await rate_limit_check(message, "command"):
+        # Rate limiting check; resolves the user as well
+        user = await rate_limit_check(message, "command")
+        if user is None:
             return
 
-        user = await get_or_create_user(message.from_user.id)
-        user_tasks = await get_user_tasks(user.id)
-
-        if not user_tasks:
-            await message.answer(
-                dedent(
-                    """
-                    ⚠️ <b>No tasks found!</b>
-                    
-                    Create your first task to see results here:
-                    <code>/task "your research description"</code>
-                    """
-                ),
-                parse_mode=ParseMode.HTML,
-            )
-            return
-
-        # Filter tasks that have completed or are active
-        relevant_tasks = [
-            t
-            for t in user_tasks
-            if t.status
-            in [TaskStatus.COMPLETED, TaskStatus.PROCESSING, TaskStatus.FAILED]
-        ]
-
-        if not relevant_tasks:
-            await message.answer(
-                dedent(
-                    """
-                    ⚠️ <b>No completed tasks found!</b>
-                    
-                    Your tasks are still processing or haven't started yet.
-                    Use /status to check current progress.
-                    """
-                ),
-                parse_mode=ParseMode.HTML,
-            )
-            return
-
-        # Create task selection keyboard
-        keyboard_buttons = []
-        for task in relevant_tasks[:10]:  # Show max 10 tasks
-            emoji = get_status_emoji(task.status)
-            button_text = f"{emoji} #{task.id}: {cut_text(task.description, 25)}"
-            callback_data = f"history_task_{task.id}"
-            keyboard_buttons.append(
-                [InlineKeyboardButton(text=button_text, callback_data=callback_data)]
-            )
-
-        # Add recent analyses option
-        keyboard_buttons.append(
-            [
-                InlineKeyboardButton(
-                    text="📊 Recent Analyses (All Tasks)",
-                    callback_data="history_recent_all",
-                )
-            ]
-        )
-
-        keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
-
-        await message.answer(
-            dedent(
-                f"""
-                📚 <b>Task History</b>
-                
-                Select a task to view its detailed results:
-                
-                📊 <b>Your Stats:</b>
-                • Total tasks: {len(user_tasks)}
-                • Completed: {len([t for t in user_tasks if t.status == TaskStatus.COMPLETED])}
-                • Processing: {len([t for t in user_tasks if t.status == TaskStatus.PROCESSING])}
-                • Failed: {len([t for t in user_tasks if t.status == TaskStatus.FAILED])}
-                """
-            ),
-            reply_markup=keyboard,
-            parse_mode=ParseMode.HTML,
-        )
+        text, keyboard = await build_history_view(user)
+        await message.answer(text, reply_markup=keyboard, parse_mode=ParseMode.HTML)
 
     except Exception as e:
         logger.error(f"Error in /history command: {e}")
@@ -563,20 +670,19 @@ async def command_history_handler(message: Message) -> None:
 async def show_task_history(callback: CallbackQuery) -> None:
     """Show detailed history for a specific task."""
     try:
-        if not callback.data:
+        task_id = _parse_callback_task_id(callback.data)
+        if task_id is None:
             await callback.answer("❌ Invalid callback data.")
             return
-        task_id = int(callback.data.split("_")[-1])
 
         if not callback.from_user:
             await callback.answer("❌ Error: could not determine user.")
             return
 
         user = await get_or_create_user(callback.from_user.id)
-        user_tasks = await get_user_tasks(user.id)
 
-        # Find the requested task and verify ownership
-        task = next((t for t in user_tasks if t.id == task_id), None)
+        # Load the requested task only if the user owns it
+        task = await get_user_task(user.id, task_id)
         if not task:
             await callback.answer("❌ Task not found or access denied.")
             return
@@ -585,54 +691,64 @@ async def show_task_history(callback: CallbackQuery) -> None:
         task_results = await get_user_task_results(task.id)
         analyses = task_results[:5]  # Limit to 5 results
 
-        history_text = dedent(
-            f"""
-            📋 <b>Task #{task.id} Details</b>
-            
-            📝 <b>Description:</b> {escape_html(task.description)}
-            📊 <b>Status:</b> {get_status_emoji(task.status)} {task.status}
-            🔄 <b>Cycles:</b> {task.cycles_completed}/{task.max_cycles}
-            
-            ⏰ <b>Created:</b> {task.created_at.strftime("%Y-%m-%d %H:%M")}
-            """
-        )
+        history_parts: list[str] = [
+            _TASK_DETAILS_TEMPLATE.format(
+                task_id=task.id,
+                description=escape_html(task.description),
+                status_emoji=get_status_emoji(task.status),
+                status=task.status,
+                cycles_completed=task.cycles_completed,
+                max_cycles=task.max_cycles,
+                created_at=task.created_at.strftime("%Y-%m-%d %H:%M"),
+            )
+        ]
 
         if task.processing_started_at:
-            history_text += f"🚀 <b>Started:</b> {task.processing_started_at.strftime('%Y-%m-%d %H:%M')}\n"
+            history_parts.append(
+                f"🚀 <b>Started:</b> {task.processing_started_at.strftime('%Y-%m-%d %H:%M')}\n"
+            )
 
         if task.processing_completed_at:
-            history_text += f"✅ <b>Completed:</b> {task.processing_completed_at.strftime('%Y-%m-%d %H:%M')}\n"
+            history_parts.append(
+                f"✅ <b>Completed:</b> {task.processing_completed_at.strftime('%Y-%m-%d %H:%M')}\n"
+            )
             if task.processing_started_at:
                 duration = task.processing_completed_at - task.processing_started_at
-                history_text += f"⏱️ <b>Duration:</b> {format_time_estimate(duration.total_seconds())}\n"
+                history_parts.append(
+                    f"⏱️ <b>Duration:</b> {format_time_estimate(duration.total_seconds())}\n"
+                )
 
         if task.error_message:
-            history_text += (
+            history_parts.append(
                 f"\n❌ <b>Error:</b> {escape_html(cut_text(task.error_message, 200))}\n"
             )
 
         # Show recent analyses
         if analyses:
-            history_text += "\n📊 <b>Recent Analysis Results:</b>\n"
+            history_parts.append("\n📊 <b>Recent Analysis Results:</b>\n")
             for i, (analysis, paper) in enumerate(analyses[:5], 1):
                 relevance = analysis.relevance
-                history_text += (
+                history_parts.append(
                     f"\n{i}. <b>{escape_html(cut_text(paper.title, 60))}</b>\n"
                 )
-                history_text += f"   📈 Relevance: {relevance:.1f}%\n"
+                history_parts.append(f"   📈 Relevance: {relevance:.1f}%\n")
                 if analysis.summary:
-                    history_text += (
+                    history_parts.append(
                         f"   💭 {escape_html(cut_text(analysis.summary, 100))}\n"
                     )
         else:
             if task.status == TaskStatus.COMPLETED:
-                history_text += "\n📊 <b>No analysis results found for this task.</b>\n"
+                history_parts.append(
+                    "\n📊 <b>No analysis results found for this task.</b>\n"
+                )
             elif task.status == TaskStatus.PROCESSING:
-                history_text += (
+                history_parts.append(
                     "\n🔄 <b>Task is still processing... Check back later!</b>\n"
                 )
             else:
-                history_text += "\n⏳ <b>No results yet - task hasn't completed.</b>\n"
+                history_parts.append(
+                    "\n⏳ <b>No results yet - task hasn't completed.</b>\n"
+                )
 
         # Create navigation keyboard
         keyboard = InlineKeyboardMarkup(
@@ -643,18 +759,16 @@ async def show_task_history(callback: CallbackQuery) -> None:
                         callback_data=f"history_more_{task_id}",
                     )
                 ],
-                [
-                    InlineKeyboardButton(
-                        text="🔙 Back to Task List", callback_data="history_back"
-                    )
-                ],
+                [_BACK_TO_LIST_BUTTON],
             ]
         )
 
         try:
             if callback.message:
                 await callback.message.edit_text(  # type: ignore
-                    history_text, reply_markup=keyboard, parse_mode=ParseMode.HTML
+                    "".join(history_parts),
+                    reply_markup=keyboard,
+                    parse_mode=ParseMode.HTML,
                 )
         except Exception:
             pass  # Message might be inaccessible
@@ -680,24 +794,8 @@ async def show_recent_analyses_all(callback: CallbackQuery) -> None:
             try:
                 if callback.message:
                     await callback.message.edit_text(  # type: ignore
-                        dedent(
-                            """
-                            📊 <b>Recent Analysis Results</b>
-                            
-                            ⚠️ No analysis results found yet.
-                            
-                            Results will appear here as your tasks complete their research cycles.
-                            """
-                        ),
-                        reply_markup=InlineKeyboardMarkup(
-                            inline_keyboard=[
-                                [
-                                    InlineKeyboardButton(
-                                        text="🔙 Back", callback_data="history_back"
-                                    )
-                                ]
-                            ]
-                        ),
+                        _NO_ANALYSES_TEXT,
+                        reply_markup=_BACK_KEYBOARD,
                         parse_mode=ParseMode.HTML,
                     )
             except Exception:
@@ -705,31 +803,29 @@ async def show_recent_analyses_all(callback: CallbackQuery) -> None:
             await callback.answer()
             return
 
-        results_text = "📊 <b>Recent Analysis Results (All Tasks)</b>\n\n"
+        results_parts: list[str] = ["📊 <b>Recent Analysis Results (All Tasks)</b>\n\n"]
 
         for i, (analysis, paper) in enumerate(analyses, 1):
             relevance = analysis.relevance
-            results_text += f"{i}. <b>{escape_html(cut_text(paper.title, 60))}</b>\n"
-            results_text += f"   📈 Relevance: {relevance:.1f}%\n"
-            results_text += f"   📅 {analysis.created_at.strftime('%m/%d %H:%M')}\n"
+            results_parts.append(
+                f"{i}. <b>{escape_html(cut_text(paper.title, 60))}</b>\n"
+            )
+            results_parts.append(f"   📈 Relevance: {relevance:.1f}%\n")
+            results_parts.append(
+                f"   📅 {analysis.created_at.strftime('%m/%d %H:%M')}\n"
+            )
             if analysis.summary:
-                results_text += f"   💭 {escape_html(cut_text(analysis.summary, 80))}\n"
-            results_text += "\n"
-
-        keyboard = InlineKeyboardMarkup(
-            inline_keyboard=[
-                [
-                    InlineKeyboardButton(
-                        text="🔙 Back to Task List", callback_data="history_back"
-                    )
-                ]
-            ]
-        )
+                results_parts.append(
+                    f"   💭 {escape_html(cut_text(analysis.summary, 80))}\n"
+                )
+            results_parts.append("\n")
 
         try:
             if callback.message:
                 await callback.message.edit_text(  # type: ignore
-                    results_text, reply_markup=keyboard, parse_mode=ParseMode.HTML
+                    "".join(results_parts),
+                    reply_markup=_BACK_TO_LIST_KEYBOARD,
+                    parse_mode=ParseMode.HTML,
                 )
         except Exception:
             pass  # Message might be inaccessible
@@ -742,9 +838,15 @@ async def show_recent_analyses_all(callback: CallbackQuery) -> None:
 
 @router.callback_query(F.data == "history_back")
 async def history_back_to_list(callback: CallbackQuery) -> None:
-    """Go back to task history list."""
-    # Re-trigger the history command logic
-    if callback.message and callback.from_user:
-        # Create a mock message object to reuse the history handler logic
-        await command_history_handler(callback.message)
+    """Go back to task history list, rebuilt so statuses are current."""
+    try:
+        user = await get_or_create_user(callback.from_user.id)
+        text, keyboard = await build_history_view(user)
+
+        if callback.message:
+            await callback.message.edit_text(  # type: ignore
+                text, reply_markup=keyboard, parse_mode=ParseMode.HTML
+            )
+    except Exception as e:
+        logger.error(f"Error returning to task history: {e}")
     await callback.answer()
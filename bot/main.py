@@ -8,11 +8,12 @@ import asyncio
 import os
 import sys
 from aiogram import Bot, Dispatcher
+from aiogram.types import ErrorEvent
 from dotenv import load_dotenv
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
-from shared.db import init_db, list_completed_tasks_since
+from shared.db import init_db, close_db
 from shared.logging import get_logger
 from bot.handlers import (
     get_general_router,
@@ -39,6 +40,32 @@ dp.include_router(get_tasks_router())
 dp.include_router(get_general_router())
 
 
+async def global_error_handler(event: ErrorEvent) -> bool:
+    """Log an unhandled handler exception and notify the user.
+
+    Handlers only guard their database section; anything else that escapes
+    them ends up here instead of in a per-handler ``try``/``except``.
+
+    :param event: aiogram error event carrying the update and the exception.
+    :returns: ``True`` to mark the error as handled.
+    """
+    logger.error(f"Unhandled error while processing update: {event.exception}")
+    message = event.update.message
+    try:
+        if message is not None:
+            await message.answer("❌ An error occurred while processing your request.")
+        elif event.update.callback_query is not None:
+            await event.update.callback_query.answer("❌ An error occurred.")
+    except Exception as reply_error:
+        # The original error may itself be a Telegram failure, or the callback
+        # query may have expired; the apology must not raise again
+        logger.debug(f"Could not notify user about the error: {reply_error}")
+    return True
+
+
+dp.errors.register(global_error_handler)
+
+
 async def main() -> None:
     """Start the bot dispatcher and background workers.
 
@@ -53,34 +80,22 @@ async def main() -> None:
     await init_db()
     logger.info("Database initialized for bot")
 
-    # Start background task to check for new analyses
-    logger.info("Starting background analysis checker...")
-    from bot.handlers.notifications import check_new_analyses
-    asyncio.create_task(check_new_analyses(bot))
-    logger.info("Background analysis checker started")
+    # Completed tasks and new analyses are delivered by a single background
+    # task; the agent runs in another process, so both are DB pollers.
+    logger.info("Starting background notification pollers...")
+    from bot.handlers.notifications import run_notification_pollers
 
-    logger.info("Telegram bot ready to work")
+    asyncio.create_task(run_notification_pollers(bot))
+    logger.info("Background notification pollers started")
 
-    # Start background task to process completed tasks (DB polling)
-    async def check_completed_tasks():
-        last_checked_id = 0
-        while True:
-            try:
-                tasks = await list_completed_tasks_since(last_checked_id)
-                for task in tasks:
-                    from bot.handlers.notifications import process_completed_task
-                    await process_completed_task(bot, task)
-                    last_checked_id = max(last_checked_id, task.id)
-                await asyncio.sleep(2)
-            except Exception as e:
-                logger.error(f"Error in completed tasks checker: {e}")
-                await asyncio.sleep(5)
-
-    asyncio.create_task(check_completed_tasks())
+    logger.info("Telegram bot ready to work")
 
     # Start the bot
     logger.info("Starting bot polling...")
-    await dp.start_polling(bot)
+    try:
+        await dp.start_polling(bot)
+    finally:
+        await close_db()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 import re
 
+_TAG_RE = re.compile(r"<[^>]*>")
+
 
 def escape_html(text: str) -> str:
     """Escape HTML special characters for Telegram HTML mode.
@@ -12,7 +14,10 @@ def escape_html(text: str) -> str:
         >>> escape_html('<b>Hi & welcome</b>')
         '&lt;b&gt;Hi &amp; welcome&lt;/b&gt;'
     """
-    # First escape HTML special characters
+    # Most titles and summaries contain none of the special characters
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
+
     text = text.replace("&", "&amp;")
     text = text.replace("<", "&lt;")
     text = text.replace(">", "&gt;")
@@ -31,7 +36,9 @@ def remove_html_tags(text: str) -> str:
         >>> remove_html_tags('<b>Hello</b> world')
         'Hello world'
     """
-    return re.sub(r"<[^>]*>", "", text)
+    if "<" not in text:
+        return text
+    return _TAG_RE.sub("", text)
 
 
 def cut_text(text: str, max_length: int) -> str:
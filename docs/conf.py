@@ -58,7 +58,6 @@ autodoc_mock_imports = [
     "arxiv",
     "feedparser",
     "PyPDF2",
-    "bs4",
     "lxml",
     "duckduckgo_search",
     "loguru",
@@ -68,7 +67,6 @@ autodoc_mock_imports = [
     "fastapi",
     "pydantic",
     "aiohttp",
-    "beautifulsoup4",
 ]
 
 templates_path = ["_templates"]
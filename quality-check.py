@@ -1,4 +1,4 @@
-from subprocess import run, CalledProcessError
+from subprocess import run, CalledProcessError, Popen
 from typing import List, Optional
 import sys
 
@@ -6,21 +6,24 @@ import sys
 def main(target: Optional[str] = None) -> None:
     """Run quality checks (ruff, pyright) on a target path.
 
+    ``ruff check --fix`` runs first because it rewrites files; formatting and
+    type checking are independent of each other and run concurrently.
+
     :param target: Optional directory or file to check. Defaults to ``"."`` if not provided.
     :returns: ``None``.
     :raises subprocess.CalledProcessError: If any subprocess fails.
     """
     check_target = target or "."
-    commands: List[List[str]] = [
-        [
-            "uv",
-            "run",
-            "ruff",
-            "check",
-            check_target,
-            "--fix",
-            "--unsafe-fixes",
-        ],
+    fix_command: List[str] = [
+        "uv",
+        "run",
+        "ruff",
+        "check",
+        check_target,
+        "--fix",
+        "--unsafe-fixes",
+    ]
+    parallel_commands: List[List[str]] = [
         [
             "uv",
             "run",
@@ -36,8 +39,13 @@ def main(target: Optional[str] = None) -> None:
         ],
     ]
     try:
-        for command in commands:
-            run(command, check=True)
+        run(fix_command, check=True)
+        processes = [Popen(command) for command in parallel_commands]
+        # Wait on every process before reporting so none is left running
+        return_codes = [process.wait() for process in processes]
+        for command, return_code in zip(parallel_commands, return_codes):
+            if return_code != 0:
+                raise CalledProcessError(return_code, command)
     except CalledProcessError as exc:
         print(f"Process failed with exit code {exc.returncode}")
         raise
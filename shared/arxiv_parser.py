@@ -16,23 +16,92 @@ clearExample::
 
 # TODO: move this to agent/browsing/manual/sources/arxiv.py
 
+import asyncio
+import functools
+import hashlib
+import io
 import os
 import re
 import logging
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
 import arxiv
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
 import PyPDF2
+from lxml import etree
+from requests.adapters import HTTPAdapter, Retry
 
 logger = logging.getLogger(__name__)
 
+# Size of the keep-alive pool shared by all downloads of one parser
+HTTP_POOL_SIZE = 16
+DOWNLOAD_CHUNK_SIZE = 65536
+# (connect, read) timeouts in seconds so a stalled connection cannot hang a worker
+HTTP_TIMEOUT = (5, 30)
+
+# Generated PDF filenames keep at most this many characters of the title
+FILENAME_TITLE_LIMIT = 50
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^\w\s-]")
+_FILENAME_SEPARATORS_RE = re.compile(r"[-\s]+")
+_VERSION_SUFFIX_RE = re.compile(r"v\d+$")
+
+# In-process cache of metadata lookups: call arguments -> (result, expires at).
+# arXiv asks clients to wait ~3s between API calls, so repeated lookups are
+# served from memory (0 disables). Paper records barely change and are kept
+# for a day; search results are kept briefly so monitoring still sees new
+# submissions.
+ARXIV_CACHE_TTL_SECONDS = float(os.getenv("ARXIV_CACHE_TTL", "86400"))
+ARXIV_SEARCH_CACHE_TTL_SECONDS = float(os.getenv("ARXIV_SEARCH_CACHE_TTL", "600"))
+ARXIV_CACHE_MAX_ENTRIES = 512
+# Extracted PDF texts kept on disk; the least recently used are deleted once
+# the cache holds more files than this (0 disables the cache)
+ARXIV_TEXT_CACHE_MAX_FILES = int(os.getenv("ARXIV_TEXT_CACHE_MAX_FILES", "2000"))
+_metadata_cache: Dict[Tuple[Any, ...], Tuple[Any, float]] = {}
+# Parsers are used from worker threads (to_thread, the download pool)
+_metadata_cache_lock = threading.Lock()
+
+
+def _get_cached_metadata(key: Tuple[Any, ...]) -> Tuple[bool, Any]:
+    """Look up a metadata lookup result in the in-process cache.
+
+    :param key: Method name followed by its arguments.
+    :returns: Tuple of (hit: bool, cached result or None).
+    """
+    with _metadata_cache_lock:
+        entry = _metadata_cache.get(key)
+    if entry is None or time.monotonic() > entry[1]:
+        return False, None
+    return True, entry[0]
+
 
-@dataclass
+def _cache_metadata(key: Tuple[Any, ...], value: Any, ttl: float) -> None:
+    """Store a metadata lookup result in the in-process cache.
+
+    :param key: Method name followed by its arguments.
+    :param value: Result to store.
+    :param ttl: Seconds the result stays valid; ``0`` or less skips caching.
+    """
+    if ttl <= 0:
+        return
+    with _metadata_cache_lock:
+        if (
+            key not in _metadata_cache
+            and len(_metadata_cache) >= ARXIV_CACHE_MAX_ENTRIES
+        ):
+            # Evict the oldest insertion
+            _metadata_cache.pop(next(iter(_metadata_cache)))
+        _metadata_cache[key] = (value, time.monotonic() + ttl)
+
+
+@dataclass(slots=True, frozen=True)
 class ArxivPaper:
     """Class for representing a scientific article from arXiv.
 
@@ -69,6 +138,9 @@ class ArxivPaper:
 class ArxivParser:
     """Main class for working with the arXiv API.
 
+    HTTP requests go through one :class:`requests.Session` per parser, so
+    consecutive and concurrent downloads reuse keep-alive connections.
+
     :param downloads_dir: Directory used to store temporary files when downloading PDFs.
     :returns: ``None``.
     """
@@ -77,6 +149,20 @@ class ArxivParser:
         self.client = arxiv.Client()
         self.downloads_dir = Path(downloads_dir)
         self.downloads_dir.mkdir(exist_ok=True)
+        self.text_cache_dir = self.downloads_dir / ".textcache"
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def search_papers(
         self,
@@ -88,6 +174,7 @@ class ArxivParser:
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         start: int = 0,
+        use_cache: bool = True,
     ) -> List[ArxivPaper]:
         """Search articles by query with optional filters.
 
@@ -99,6 +186,8 @@ class ArxivParser:
         :param date_from: Start date for results (inclusive).
         :param date_to: End date for results (inclusive).
         :param start: Starting index for pagination (default 0).
+        :param use_cache: Reuse a recent identical search; pass ``False`` when
+            the caller polls for new submissions.
         :returns: Found papers as typed records.
         """
         try:
@@ -107,42 +196,44 @@ class ArxivParser:
                 query, categories, date_from, date_to
             )
 
-            # Create search object
+            # Key on the built query: dates only enter it at day granularity, so
+            # rolling windows such as get_recent_papers can hit as well
+            cache_key = (
+                "search_papers",
+                search_query,
+                max_results,
+                sort_by,
+                sort_order,
+                start,
+            )
+            if use_cache:
+                hit, cached = _get_cached_metadata(cache_key)
+                if hit:
+                    return list(cached)
+
+            # Create search object; the page ends ``max_results`` past ``start``
             search = arxiv.Search(
                 query=search_query,
-                max_results=max_results,
+                max_results=start + max_results,
                 sort_by=sort_by,
                 sort_order=sort_order,
             )
 
-            # Execute search with pagination support
-            results = []
-            processed_count = 0
-            skipped_count = 0
-
-            for result in self.client.results(search):
-                # Skip results until we reach the start position
-                if skipped_count < start:
-                    skipped_count += 1
-                    continue
-
-                # Stop when we have enough results
-                if processed_count >= max_results:
-                    break
-
-                paper = self._convert_to_arxiv_paper(result)
-                results.append(paper)
-                processed_count += 1
-
-            logger.info(
-                f"Found {len(results)} articles for query: {query} (start={start}, skipped={skipped_count})"
-            )
-            return results
+            # The offset is sent to the API, so skipped records are never fetched
+            results = [
+                self._convert_to_arxiv_paper(result)
+                for result in self.client.results(search, offset=start)
+            ]
 
         except Exception as e:
             logger.error(f"Error searching articles: {e}")
             return []
 
+        logger.info(f"Found {len(results)} articles for query: {query} (start={start})")
+        # Outside the try: a caching problem must not discard fetched results
+        _cache_metadata(cache_key, tuple(results), ARXIV_SEARCH_CACHE_TTL_SECONDS)
+        return results
+
     def get_paper_by_id(self, arxiv_id: str) -> Optional[ArxivPaper]:
         """Get article data by ID.
 
@@ -152,24 +243,28 @@ class ArxivParser:
         try:
             # Normalize ID
             clean_id = self._clean_arxiv_id(arxiv_id)
+            hit, cached = _get_cached_metadata(("get_paper_by_id", clean_id))
+            if hit:
+                return cached
 
             # Create search query by ID
             search = arxiv.Search(id_list=[clean_id])
 
-            # Get result
-            results = list(self.client.results(search))
-            if results:
-                paper = self._convert_to_arxiv_paper(results[0])
-                logger.info(f"Found article: {paper.title}")
-                return paper
-            else:
+            # Get result; only the first record is needed
+            result = next(self.client.results(search), None)
+            if result is None:
                 logger.warning(f"Article with ID {arxiv_id} not found")
                 return None
+            paper = self._convert_to_arxiv_paper(result)
 
         except Exception as e:
             logger.error(f"Error getting article {arxiv_id}: {e}")
             return None
 
+        logger.info(f"Found article: {paper.title}")
+        _cache_metadata(("get_paper_by_id", clean_id), paper, ARXIV_CACHE_TTL_SECONDS)
+        return paper
+
     def download_pdf(
         self, paper: ArxivPaper, filename: Optional[str] = None
     ) -> Optional[str]:
@@ -182,19 +277,22 @@ class ArxivParser:
         try:
             if not filename:
                 # Generate filename from ID and title
-                safe_title = re.sub(r"[^\w\s-]", "", paper.title)[:50]
-                safe_title = re.sub(r"[-\s]+", "-", safe_title)
+                safe_title = _UNSAFE_FILENAME_CHARS_RE.sub("", paper.title)
+                safe_title = safe_title[:FILENAME_TITLE_LIMIT]
+                safe_title = _FILENAME_SEPARATORS_RE.sub("-", safe_title)
                 filename = f"{paper.id}_{safe_title}.pdf"
 
             filepath = self.downloads_dir / filename
 
             # Download PDF
-            response = requests.get(paper.pdf_url, stream=True)
-            response.raise_for_status()
+            with self.session.get(
+                paper.pdf_url, stream=True, timeout=HTTP_TIMEOUT
+            ) as response:
+                response.raise_for_status()
 
-            with open(filepath, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                with open(filepath, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
 
             logger.info(f"PDF downloaded: {filepath}")
             return str(filepath)
@@ -203,6 +301,24 @@ class ArxivParser:
             logger.error(f"Error downloading PDF {paper.id}: {e}")
             return None
 
+    def download_pdfs(
+        self, papers: Iterable[ArxivPaper], max_workers: int = 8
+    ) -> Iterator[Tuple[ArxivPaper, Optional[str]]]:
+        """Download several PDFs concurrently over the shared connection pool.
+
+        :param papers: Papers to download.
+        :param max_workers: Maximum number of parallel downloads.
+        :returns: Iterator of ``(paper, path)`` pairs in completion order; ``path``
+            is ``None`` for failed downloads.
+        """
+        workers = max(1, min(max_workers, HTTP_POOL_SIZE))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.download_pdf, paper): paper for paper in papers
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
     def extract_text_from_pdf(self, pdf_path: str) -> Optional[str]:
         """Extract text from a PDF file.
 
@@ -210,20 +326,90 @@ class ArxivParser:
         :returns: Extracted text or ``None`` on error.
         """
         try:
-            with open(pdf_path, "rb") as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
+            data = Path(pdf_path).read_bytes()
+        except Exception as e:
+            logger.error(f"Error extracting text from PDF {pdf_path}: {e}")
+            return None
+        return self.extract_text_from_pdf_bytes(data, source=pdf_path)
 
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n\n"
+    def extract_text_from_pdf_bytes(
+        self, data: bytes, source: str = "<memory>"
+    ) -> Optional[str]:
+        """Extract text from PDF contents held in memory.
 
-                logger.info(f"Text extracted from PDF: {len(text)} characters")
-                return text.strip()
+        The text is cached under ``downloads_dir/.textcache`` by the SHA-256 of
+        the contents, so the same PDF is parsed only once. The cache keeps at
+        most :data:`ARXIV_TEXT_CACHE_MAX_FILES` files.
+
+        :param data: Raw PDF bytes.
+        :param source: Label used in log messages (path or URL).
+        :returns: Extracted text or ``None`` on error.
+        """
+        try:
+            digest = hashlib.sha256(data).hexdigest()
+            cached = self._read_text_cache(digest)
+            if cached is not None:
+                logger.info(f"Text for PDF {source} served from cache")
+                return cached
+
+            pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+            text = "\n\n".join(page.extract_text() for page in pdf_reader.pages)
+
+            logger.info(f"Text extracted from PDF: {len(text)} characters")
+            text = text.strip()
+            self._write_text_cache(digest, text)
+            return text
 
         except Exception as e:
-            logger.error(f"Error extracting text from PDF {pdf_path}: {e}")
+            logger.error(f"Error extracting text from PDF {source}: {e}")
             return None
 
+    def _read_text_cache(self, digest: str) -> Optional[str]:
+        """Return cached text for a PDF digest, or ``None`` on a miss."""
+        if ARXIV_TEXT_CACHE_MAX_FILES <= 0:
+            return None
+        path = self.text_cache_dir / f"{digest}.txt"
+        try:
+            text = path.read_text(encoding="utf-8")
+            # Refresh the modification time so eviction drops unused texts first
+            os.utime(path)
+            return text
+        except OSError:
+            return None
+
+    def _write_text_cache(self, digest: str, text: str) -> None:
+        """Store extracted text for a PDF digest; failures are only logged."""
+        if ARXIV_TEXT_CACHE_MAX_FILES <= 0:
+            return
+        try:
+            self.text_cache_dir.mkdir(exist_ok=True)
+            # Write to a temporary file first so readers never see partial text
+            fd, tmp_path = tempfile.mkstemp(dir=self.text_cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, self.text_cache_dir / f"{digest}.txt")
+            self._prune_text_cache()
+        except OSError as e:
+            logger.warning(f"Could not cache extracted text {digest}: {e}")
+
+    def _prune_text_cache(self) -> None:
+        """Delete the least recently used texts beyond the cache's file limit."""
+        entries = [
+            (entry.stat().st_mtime, entry.path)
+            for entry in os.scandir(self.text_cache_dir)
+            if entry.name.endswith(".txt")
+        ]
+        excess = len(entries) - ARXIV_TEXT_CACHE_MAX_FILES
+        if excess <= 0:
+            return
+        entries.sort()
+        for _mtime, path in entries[:excess]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Another worker pruned it first
+                pass
+
     def get_paper_text_online(self, paper: ArxivPaper) -> Optional[str]:
         """Get article text online without downloading the PDF.
 
@@ -234,32 +420,46 @@ class ArxivParser:
             # First try to get through HTML version
             html_url = paper.abs_url.replace("/abs/", "/html/")
 
-            response = requests.get(html_url)
+            response = self.session.get(html_url, timeout=HTTP_TIMEOUT)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, "html.parser")
-
-                # Find main text
-                content_div = soup.find("div", class_="ltx_page_content")
-                if content_div:
-                    text = content_div.get_text(strip=True)
+                text = self._extract_html_main_text(response.content)
+                if text:
                     logger.info(f"Text obtained online (HTML): {len(text)} characters")
                     return text
 
-            # If HTML not available, download and parse PDF
+            # If HTML not available, fetch and parse the PDF in memory
             logger.info("HTML version not available, downloading PDF...")
-            pdf_path = self.download_pdf(paper)
-            if pdf_path:
-                text = self.extract_text_from_pdf(pdf_path)
-                # Remove temporary file
-                os.remove(pdf_path)
-                return text
-
-            return None
+            response = self.session.get(paper.pdf_url, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            return self.extract_text_from_pdf_bytes(
+                response.content, source=paper.pdf_url
+            )
 
         except Exception as e:
             logger.error(f"Error getting text online {paper.id}: {e}")
             return None
 
+    async def aget_paper_texts(
+        self, papers: Iterable[ArxivPaper], max_concurrency: int = 8
+    ) -> List[Optional[str]]:
+        """Fetch the text of several papers concurrently.
+
+        Each paper goes through :meth:`get_paper_text_online` in a worker thread,
+        so the event loop stays free and requests share the parser's
+        connection pool.
+
+        :param papers: Papers to fetch.
+        :param max_concurrency: Maximum number of papers fetched at once.
+        :returns: Texts in the order of ``papers``; ``None`` where fetching failed.
+        """
+        semaphore = asyncio.Semaphore(max(1, min(max_concurrency, HTTP_POOL_SIZE)))
+
+        async def fetch(paper: ArxivPaper) -> Optional[str]:
+            async with semaphore:
+                return await asyncio.to_thread(self.get_paper_text_online, paper)
+
+        return list(await asyncio.gather(*(fetch(paper) for paper in papers)))
+
     def search_by_author(
         self, author_name: str, max_results: int = 10
     ) -> List[ArxivPaper]:
@@ -357,6 +557,27 @@ class ArxivParser:
             primary_category=result.primary_category,
         )
 
+    def _extract_html_main_text(self, content: bytes) -> Optional[str]:
+        """Extract the main text of an arXiv HTML (LaTeXML) page.
+
+        :param content: Raw HTML bytes.
+        :returns: Text of the ``ltx_page_content`` block, or ``None`` if absent.
+        """
+        try:
+            tree = lxml.html.fromstring(content)
+        except (etree.ParserError, ValueError):
+            return None
+        content_div = next(
+            (el for el in tree.find_class("ltx_page_content") if el.tag == "div"),
+            None,
+        )
+        if content_div is None:
+            return None
+        # Script and style contents are not article text
+        for element in content_div.xpath(".//script|.//style"):
+            element.drop_tree()
+        return "".join(part.strip() for part in content_div.itertext())
+
     def _clean_arxiv_id(self, arxiv_id: str) -> str:
         """Clean and normalize arXiv ID.
 
@@ -366,13 +587,26 @@ class ArxivParser:
         # Remove "arXiv:" prefix if present
         clean_id = arxiv_id.replace("arXiv:", "")
         # Remove version if present (e.g., v1, v2)
-        clean_id = re.sub(r"v\d+$", "", clean_id)
+        clean_id = _VERSION_SUFFIX_RE.sub("", clean_id)
         return clean_id
 
 
 # Helper functions for convenience
 
 
+@functools.lru_cache(maxsize=8)
+def get_parser(downloads_dir: str = "downloads") -> ArxivParser:
+    """Return a process-wide parser for ``downloads_dir``.
+
+    Reusing one parser keeps the arXiv client and the HTTP session warm, so
+    repeated calls share keep-alive connections instead of reconnecting.
+
+    :param downloads_dir: Directory to store downloaded PDFs.
+    :returns: Shared :class:`ArxivParser` instance.
+    """
+    return ArxivParser(downloads_dir)
+
+
 def search_papers(query: str, max_results: int = 10) -> List[ArxivPaper]:
     """Quick article search.
 
@@ -380,8 +614,7 @@ def search_papers(query: str, max_results: int = 10) -> List[ArxivPaper]:
     :param max_results: Maximum number of results to return.
     :returns: List of :class:`ArxivPaper` instances.
     """
-    parser = ArxivParser()
-    return parser.search_papers(query, max_results)
+    return get_parser().search_papers(query, max_results)
 
 
 def get_paper(arxiv_id: str) -> Optional[ArxivPaper]:
@@ -390,8 +623,7 @@ def get_paper(arxiv_id: str) -> Optional[ArxivPaper]:
     :param arxiv_id: arXiv identifier.
     :returns: :class:`ArxivPaper` instance or ``None``.
     """
-    parser = ArxivParser()
-    return parser.get_paper_by_id(arxiv_id)
+    return get_parser().get_paper_by_id(arxiv_id)
 
 
 def download_paper(arxiv_id: str, downloads_dir: str = "downloads") -> Optional[str]:
@@ -401,7 +633,7 @@ def download_paper(arxiv_id: str, downloads_dir: str = "downloads") -> Optional[
     :param downloads_dir: Directory to store the PDF file.
     :returns: Path to the downloaded PDF or ``None``.
     """
-    parser = ArxivParser(downloads_dir)
+    parser = get_parser(downloads_dir)
     paper = parser.get_paper_by_id(arxiv_id)
     if paper:
         return parser.download_pdf(paper)
@@ -4,7 +4,7 @@ This package provides a modular database layer with SQLAlchemy async support.
 All database models, enums, and operations are organized into separate modules.
 """
 
-from .connection import engine, SessionLocal, init_db
+from .connection import engine, SessionLocal, init_db, optimize_db, close_db
 from .enums import UserPlan, TaskStatus
 from .models import (
     Base,
@@ -21,6 +21,7 @@ from .models import (
     PaperAnalysis,
     UserSettings,
     AgentStatus,
+    NotificationCursor,
 )
 from .operations import (
     # User operations
@@ -38,6 +39,10 @@ from .operations import (
     create_user_task_with_queue,
     create_user_task,
     get_user_tasks,
+    get_user_task,
+    list_recent_user_tasks,
+    count_user_tasks_by_status,
+    count_user_active_tasks,
     update_user_task_status,
     update_user_task_status_for_user,
     deactivate_user_tasks,
@@ -55,13 +60,18 @@ from .operations import (
     list_active_topics,
     get_topic_by_user_and_text,
     create_arxiv_paper,
+    get_or_create_arxiv_papers,
     get_arxiv_paper_by_arxiv_id,
     create_paper_analysis,
+    create_paper_analyses,
     has_paper_analysis,
     list_new_analyses_since,
     get_analysis_with_entities,
     mark_analysis_notified,
     mark_analysis_queued,
+    mark_analyses_notified_bulk,
+    mark_analyses_queued_bulk,
+    mark_analyses_analyzed_bulk,
     list_recent_analyses_for_user,
     update_agent_status,
     get_agent_status,
@@ -76,6 +86,7 @@ from .operations import (
     mark_task_failed,
     list_completed_tasks_since,
     mark_task_sent,
+    mark_tasks_sent_bulk,
     get_task,
     # Search query operations
     list_active_queries_for_task,
@@ -89,7 +100,11 @@ from .operations import (
     complete_task_processing,
     create_research_topic_for_user_task,
     link_analysis_to_user_task,
+    link_analyses_to_user_task,
     get_user_task_results,
+    # Notification cursor operations
+    get_notification_cursor,
+    save_notification_cursor,
 )
 
 # Backward compatibility
@@ -100,6 +115,8 @@ __all__ = [
     "engine",
     "SessionLocal",
     "init_db",
+    "optimize_db",
+    "close_db",
     "ensure_connection",
     # Enums
     "UserPlan",
@@ -118,6 +135,7 @@ __all__ = [
     "PaperAnalysis",
     "UserSettings",
     "AgentStatus",
+    "NotificationCursor",
     # Operations
     "get_or_create_user",
     "upgrade_user_plan",
@@ -129,6 +147,10 @@ __all__ = [
     "get_next_task_from_queue",
     "create_user_task_with_queue",
     "get_user_tasks",
+    "get_user_task",
+    "list_recent_user_tasks",
+    "count_user_tasks_by_status",
+    "count_user_active_tasks",
     "update_user_task_status",
     "update_user_task_status_for_user",
     "deactivate_user_tasks",
@@ -144,13 +166,18 @@ __all__ = [
     "list_active_topics",
     "get_topic_by_user_and_text",
     "create_arxiv_paper",
+    "get_or_create_arxiv_papers",
     "get_arxiv_paper_by_arxiv_id",
     "create_paper_analysis",
+    "create_paper_analyses",
     "has_paper_analysis",
     "list_new_analyses_since",
     "get_analysis_with_entities",
     "mark_analysis_notified",
     "mark_analysis_queued",
+    "mark_analyses_notified_bulk",
+    "mark_analyses_queued_bulk",
+    "mark_analyses_analyzed_bulk",
     "list_recent_analyses_for_user",
     "update_agent_status",
     "get_agent_status",
@@ -164,6 +191,7 @@ __all__ = [
     "mark_task_failed",
     "list_completed_tasks_since",
     "mark_task_sent",
+    "mark_tasks_sent_bulk",
     "get_task",
     "list_active_queries_for_task",
     "create_search_query",
@@ -176,7 +204,11 @@ __all__ = [
     "complete_task_processing",
     "create_research_topic_for_user_task",
     "link_analysis_to_user_task",
+    "link_analyses_to_user_task",
     "get_user_task_results",
+    # Notification cursor operations
+    "get_notification_cursor",
+    "save_notification_cursor",
     # Legacy function
     "create_user_task",
 ]
@@ -1,25 +1,75 @@
 """Database connection management."""
 
 import os
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 
+from shared.logging import get_logger
+
 from .models import Base
 
+logger = get_logger(__name__)
+
 DATABASE_PATH = os.getenv("DATABASE_PATH", "database.db")
 DATABASE_URL = f"sqlite+aiosqlite:///{DATABASE_PATH}"
 
-engine = create_async_engine(DATABASE_URL, echo=False, future=True)
+# Connections kept open for concurrent handlers; bounded so SQLite is not flooded
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "16"))
+# Seconds a connection waits on a lock held by another writer (bot and agent
+# share one file) before raising "database is locked"
+DATABASE_BUSY_TIMEOUT = float(os.getenv("DATABASE_BUSY_TIMEOUT", "30"))
+# Page size for newly created database files (existing files keep theirs)
+DATABASE_PAGE_SIZE = 8192
+
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    future=True,
+    pool_size=DATABASE_POOL_SIZE,
+    max_overflow=0,
+    connect_args={"timeout": DATABASE_BUSY_TIMEOUT},
+)
 SessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 
+@event.listens_for(engine.sync_engine, "connect")
+def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """Apply SQLite pragmas once per pooled connection.
+
+    WAL lets the agent's writes proceed alongside the bot's reads, and
+    ``synchronous=NORMAL`` is durable under WAL while skipping an fsync per
+    commit. ``cache_size`` is negative, i.e. in KiB (64 MiB per connection).
+    Sort and GROUP BY scratch space stays in memory, and up to 256 MiB of the
+    file is read through a memory map instead of ``read()`` calls. Larger
+    pages keep long text columns out of overflow chains; ``page_size`` only
+    takes effect on a database that has not been written yet.
+
+    :param dbapi_connection: Raw DBAPI connection being opened by the pool.
+    :param connection_record: Pool record for the connection (unused).
+    :returns: ``None``.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA page_size={DATABASE_PAGE_SIZE}")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
 async def init_db() -> None:
     """Initialize database and create all tables including new user management and queue tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
+        await conn.run_sync(_drop_replaced_indexes)
+        # Refresh planner statistics on open, bounded so large tables stay cheap
+        await conn.exec_driver_sql("PRAGMA optimize=0x10002")
 
     # Initialize default task statistics if none exist
     from .operations import get_or_create_task_statistics
@@ -27,6 +77,61 @@ async def init_db() -> None:
     await get_or_create_task_statistics()
 
 
+def _create_missing_indexes(sync_conn) -> None:
+    """Create model indexes that are missing from already existing tables.
+
+    ``create_all`` skips tables that exist, together with their indexes, so
+    indexes added to the models later would never reach an existing database.
+
+    :param sync_conn: Synchronous connection provided by ``run_sync``.
+    :returns: ``None``.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
+# Indexes that models no longer declare because a wider index replaced them;
+# existing databases still carry them and pay for them on every write
+_REPLACED_INDEXES = ("idx_queue_priority", "idx_user_status")
+
+
+def _drop_replaced_indexes(sync_conn) -> None:
+    """Drop indexes that were superseded by wider ones on the models.
+
+    :param sync_conn: Synchronous connection provided by ``run_sync``.
+    :returns: ``None``.
+    """
+    for name in _REPLACED_INDEXES:
+        sync_conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+
+
+async def optimize_db() -> None:
+    """Let SQLite refresh stale planner statistics.
+
+    ``PRAGMA optimize`` only re-analyzes tables whose statistics are out of
+    date, so it is cheap to run periodically from long-lived processes.
+
+    :returns: ``None``.
+    """
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("PRAGMA optimize")
+
+
+async def close_db() -> None:
+    """Optimize the database and close all pooled connections on shutdown.
+
+    :returns: ``None``.
+    """
+    try:
+        await optimize_db()
+    except Exception as error:
+        # Statistics are an optimization; the pool must still be closed
+        logger.warning(f"PRAGMA optimize failed on shutdown: {error}")
+    finally:
+        await engine.dispose()
+
+
 def ensure_connection() -> None:
     """Async SQLAlchemy manages connections via the session. No-op retained for compatibility."""
     return None
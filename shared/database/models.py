@@ -133,7 +133,10 @@ class TaskQueue(Base):
 
     task: Mapped["UserTask"] = relationship(back_populates="queue_entry", lazy="select")
 
-    __table_args__ = (Index("idx_queue_priority", "priority", "created_at"),)
+    __table_args__ = (
+        # Queue pop walks this in order; task_id makes the join index-only
+        Index("idx_queue_pop", "priority", "created_at", "task_id"),
+    )
 
 
 class TaskStatistics(Base):
@@ -214,7 +217,8 @@ class UserTask(Base):
     )
 
     __table_args__ = (
-        Index("idx_user_status", "user_id", "status"),
+        # Also serves "latest N tasks in these statuses" without a sort step
+        Index("idx_user_status_updated", "user_id", "status", "updated_at"),
         Index("idx_status_created", "status", "created_at"),
     )
 
@@ -251,6 +255,9 @@ class Finding(Base):
     notified_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
 
+    # Task results: findings of a task, joined to analyses by paper
+    __table_args__ = (Index("idx_finding_task_paper", "task_id", "paper_id"),)
+
 
 # Legacy Models (Still used by agent system)
 
@@ -327,6 +334,12 @@ class PaperAnalysis(Base):
         back_populates="analyses", lazy="select"
     )
 
+    __table_args__ = (
+        Index("idx_analysis_status_id", "status", "id"),
+        # Duplicate checks per (paper, topic) and the join from findings
+        Index("idx_analysis_paper_topic", "paper_id", "topic_id"),
+    )
+
 
 class UserSettings(Base):
     """User settings for filtering and analysis."""
@@ -372,6 +385,17 @@ class AgentStatus(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
 
 
+class NotificationCursor(Base):
+    """Persisted watermark of the last record processed by a notification poller."""
+
+    __tablename__ = "notification_cursor"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(50), unique=True)
+    last_id: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+
+
 # Legacy models for backward compatibility (not actively used)
 
 
@@ -410,3 +434,10 @@ class Task(Base):
     message: Mapped[Optional[Message]] = relationship(
         back_populates="tasks", lazy="select"
     )
+
+    __table_args__ = (
+        # Agent pickup: pending tasks oldest first
+        Index("idx_task_status_created", "status", "created_at"),
+        # Bot delivery cursor: completed tasks after the last delivered ID
+        Index("idx_task_status_id", "status", "id"),
+    )
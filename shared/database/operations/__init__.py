@@ -25,6 +25,10 @@ from .task_statistics import (
 from .task import (
     create_user_task_with_queue,
     get_user_tasks,
+    get_user_task,
+    list_recent_user_tasks,
+    count_user_tasks_by_status,
+    count_user_active_tasks,
     update_user_task_status,
     update_user_task_status_for_user,
     deactivate_user_tasks,
@@ -54,12 +58,17 @@ from .legacy import (
 from .paper import (
     get_arxiv_paper_by_arxiv_id,
     create_arxiv_paper,
+    get_or_create_arxiv_papers,
     has_paper_analysis,
     create_paper_analysis,
+    create_paper_analyses,
     list_new_analyses_since,
     get_analysis_with_entities,
     mark_analysis_notified,
     mark_analysis_queued,
+    mark_analyses_notified_bulk,
+    mark_analyses_queued_bulk,
+    mark_analyses_analyzed_bulk,
 )
 
 from .agent import (
@@ -78,15 +87,22 @@ from .generic_task import (
     mark_task_failed,
     list_completed_tasks_since,
     mark_task_sent,
+    mark_tasks_sent_bulk,
     get_task,
 )
 
+from .cursor import (
+    get_notification_cursor,
+    save_notification_cursor,
+)
+
 from .integration import (
     get_next_queued_task,
     start_task_processing,
     complete_task_processing,
     create_research_topic_for_user_task,
     link_analysis_to_user_task,
+    link_analyses_to_user_task,
     get_user_task_results,
     create_user_task,
 )
@@ -109,6 +125,10 @@ __all__ = [
     # Task operations
     "create_user_task_with_queue",
     "get_user_tasks",
+    "get_user_task",
+    "list_recent_user_tasks",
+    "count_user_tasks_by_status",
+    "count_user_active_tasks",
     "update_user_task_status",
     "update_user_task_status_for_user",
     "deactivate_user_tasks",
@@ -132,12 +152,17 @@ __all__ = [
     # Paper operations
     "get_arxiv_paper_by_arxiv_id",
     "create_arxiv_paper",
+    "get_or_create_arxiv_papers",
     "has_paper_analysis",
     "create_paper_analysis",
+    "create_paper_analyses",
     "list_new_analyses_since",
     "get_analysis_with_entities",
     "mark_analysis_notified",
     "mark_analysis_queued",
+    "mark_analyses_notified_bulk",
+    "mark_analyses_queued_bulk",
+    "mark_analyses_analyzed_bulk",
     # Agent operations
     "update_agent_status",
     "get_agent_status",
@@ -152,13 +177,18 @@ __all__ = [
     "mark_task_failed",
     "list_completed_tasks_since",
     "mark_task_sent",
+    "mark_tasks_sent_bulk",
     "get_task",
+    # Cursor operations
+    "get_notification_cursor",
+    "save_notification_cursor",
     # Integration operations
     "get_next_queued_task",
     "start_task_processing",
     "complete_task_processing",
     "create_research_topic_for_user_task",
     "link_analysis_to_user_task",
+    "link_analyses_to_user_task",
     "get_user_task_results",
     "create_user_task",
 ]
@@ -0,0 +1,40 @@
+"""Notification cursor operations."""
+
+from datetime import datetime
+
+from sqlalchemy import select
+
+from ..connection import SessionLocal
+from ..models import NotificationCursor
+
+
+async def get_notification_cursor(name: str) -> int:
+    """Get the last processed ID stored for a poller.
+
+    :param name: Cursor name
+    :returns: Last processed ID, or 0 if the cursor does not exist yet
+    """
+    async with SessionLocal() as session:
+        result = await session.execute(
+            select(NotificationCursor.last_id).where(NotificationCursor.name == name)
+        )
+        return int(result.scalar_one_or_none() or 0)
+
+
+async def save_notification_cursor(name: str, last_id: int) -> None:
+    """Store the last processed ID for a poller.
+
+    :param name: Cursor name
+    :param last_id: Last processed ID
+    """
+    async with SessionLocal() as session:
+        result = await session.execute(
+            select(NotificationCursor).where(NotificationCursor.name == name)
+        )
+        cursor = result.scalar_one_or_none()
+        if cursor is None:
+            cursor = NotificationCursor(name=name)
+            session.add(cursor)
+        cursor.last_id = last_id
+        cursor.updated_at = datetime.now()
+        await session.commit()
@@ -4,7 +4,7 @@ import json
 from datetime import datetime
 from typing import Any, List, Optional
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, update
 
 from ..connection import SessionLocal
 from ..models import Task
@@ -53,12 +53,11 @@ async def mark_task_completed(task_id: int, result_text: Optional[str]) -> None:
     :param result_text: Result text
     """
     async with SessionLocal() as session:
-        task = await session.get(Task, task_id)
-        if task is None:
-            return
-        task.status = "completed"
-        task.result = result_text
-        task.updated_at = datetime.now()
+        await session.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(status="completed", result=result_text, updated_at=datetime.now())
+        )
         await session.commit()
 
 
@@ -69,12 +68,11 @@ async def mark_task_failed(task_id: int, error_text: str) -> None:
     :param error_text: Error text
     """
     async with SessionLocal() as session:
-        task = await session.get(Task, task_id)
-        if task is None:
-            return
-        task.status = "failed"
-        task.result = error_text
-        task.updated_at = datetime.now()
+        await session.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(status="failed", result=error_text, updated_at=datetime.now())
+        )
         await session.commit()
 
 
@@ -98,12 +96,22 @@ async def mark_task_sent(task_id: int) -> None:
 
     :param task_id: Task ID
     """
+    await mark_tasks_sent_bulk([task_id])
+
+
+async def mark_tasks_sent_bulk(task_ids: List[int]) -> None:
+    """Mark several tasks as sent in one round-trip.
+
+    :param task_ids: Task IDs
+    """
+    if not task_ids:
+        return
     async with SessionLocal() as session:
-        task = await session.get(Task, task_id)
-        if task is None:
-            return
-        task.status = "sent"
-        task.updated_at = datetime.now()
+        await session.execute(
+            update(Task)
+            .where(Task.id.in_(task_ids))
+            .values(status="sent", updated_at=datetime.now())
+        )
         await session.commit()
 
 
@@ -197,16 +197,31 @@ async def link_analysis_to_user_task(
     :param analysis: PaperAnalysis instance
     :param user_task: UserTask instance
     """
+    await link_analyses_to_user_task([analysis], user_task)
+
+
+async def link_analyses_to_user_task(
+    analyses: List[PaperAnalysis], user_task: UserTask
+) -> None:
+    """Link several paper analyses to a user task in one transaction.
+
+    :param analyses: PaperAnalysis instances
+    :param user_task: UserTask instance
+    """
+    if not analyses:
+        return
     async with SessionLocal() as session:
-        # Create finding record
-        finding = Finding(
-            task_id=user_task.id,
-            paper_id=analysis.paper_id,
-            relevance=analysis.relevance,
-            summary=analysis.summary,
+        session.add_all(
+            [
+                Finding(
+                    task_id=user_task.id,
+                    paper_id=analysis.paper_id,
+                    relevance=analysis.relevance,
+                    summary=analysis.summary,
+                )
+                for analysis in analyses
+            ]
         )
-
-        session.add(finding)
         await session.commit()
 
 
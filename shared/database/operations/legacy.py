@@ -1,64 +1,118 @@
 """Legacy operations for compatibility."""
 
+import os
+import time
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import select, and_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from ..connection import SessionLocal
 from ..models import UserSettings, ResearchTopic
 
+# In-process cache of user settings: user_id -> (settings or None, stored at).
+# Writes through update_user_settings; other processes see changes after the TTL,
+# so deployments running several bot/agent processes can shorten it (0 disables).
+SETTINGS_CACHE_TTL_SECONDS = float(os.getenv("SETTINGS_CACHE_TTL", "30"))
+_settings_cache: Dict[int, Tuple[Optional[UserSettings], float]] = {}
+
+
+def _get_cached_settings(user_id: int) -> Tuple[bool, Optional[UserSettings]]:
+    """Look up user settings in the in-process cache.
+
+    :param user_id: User ID
+    :returns: Tuple of (hit: bool, settings or None)
+    """
+    if SETTINGS_CACHE_TTL_SECONDS <= 0:
+        return False, None
+    entry = _settings_cache.get(user_id)
+    if entry is None or time.monotonic() - entry[1] > SETTINGS_CACHE_TTL_SECONDS:
+        return False, None
+    return True, entry[0]
+
+
+def _cache_settings(user_id: int, settings: Optional[UserSettings]) -> None:
+    """Store user settings in the in-process cache.
+
+    :param user_id: User ID
+    :param settings: UserSettings instance or None if the user has no settings
+    """
+    if SETTINGS_CACHE_TTL_SECONDS <= 0:
+        return
+    _settings_cache[user_id] = (settings, time.monotonic())
+
 
 async def get_user_settings(user_id: int) -> Optional[UserSettings]:
-    """Get user settings.
+    """Get user settings, served from the in-process cache when fresh.
 
     :param user_id: User ID
     :returns: UserSettings instance or None
     """
+    hit, cached = _get_cached_settings(user_id)
+    if hit:
+        return cached
     async with SessionLocal() as session:
         result = await session.execute(
             select(UserSettings).where(UserSettings.user_id == user_id)
         )
-        return result.scalar_one_or_none()
+        settings = result.scalar_one_or_none()
+    _cache_settings(user_id, settings)
+    return settings
 
 
 async def get_or_create_user_settings(user_id: int) -> UserSettings:
     """Get or create user settings.
 
+    A cache miss is resolved with one ``INSERT ... ON CONFLICT DO UPDATE
+    ... RETURNING`` statement that leaves an existing row untouched.
+
     :param user_id: User ID
     :returns: UserSettings instance
     """
-    async with SessionLocal() as session:
-        result = await session.execute(
-            select(UserSettings).where(UserSettings.user_id == user_id)
+    hit, cached = _get_cached_settings(user_id)
+    if hit and cached is not None:
+        return cached
+    stmt = (
+        sqlite_insert(UserSettings)
+        .values(user_id=user_id)
+        .on_conflict_do_update(
+            index_elements=[UserSettings.user_id],
+            set_={"user_id": UserSettings.user_id},
         )
-        settings = result.scalar_one_or_none()
-        if settings is None:
-            settings = UserSettings(user_id=user_id)
-            session.add(settings)
-            await session.commit()
-            await session.refresh(settings)
-        return settings
+        .returning(UserSettings)
+    )
+    async with SessionLocal() as session:
+        result = await session.execute(stmt)
+        settings = result.scalar_one()
+        await session.commit()
+    _cache_settings(user_id, settings)
+    return settings
+
 
+async def update_user_settings(user_id: int, **fields: Any) -> UserSettings:
+    """Update user settings and refresh the cached copy.
 
-async def update_user_settings(user_id: int, **fields: Any) -> None:
-    """Update user settings.
+    Runs as a single ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING``
+    statement, creating the settings row when the user has none yet.
 
     :param user_id: User ID
     :param fields: Fields to update
+    :returns: Updated UserSettings instance
     """
+    values = {**fields, "updated_at": datetime.now()}
+    stmt = (
+        sqlite_insert(UserSettings)
+        .values(user_id=user_id, **values)
+        .on_conflict_do_update(index_elements=[UserSettings.user_id], set_=values)
+        .returning(UserSettings)
+    )
     async with SessionLocal() as session:
-        result = await session.execute(
-            select(UserSettings).where(UserSettings.user_id == user_id)
-        )
-        settings = result.scalar_one_or_none()
-        if settings is None:
-            settings = UserSettings(user_id=user_id)
-            session.add(settings)
-        for key, value in fields.items():
-            setattr(settings, key, value)
-        settings.updated_at = datetime.now()
+        result = await session.execute(stmt)
+        settings = result.scalar_one()
         await session.commit()
+    _cache_settings(user_id, settings)
+    return settings
 
 
 async def deactivate_user_topics(user_id: int) -> None:
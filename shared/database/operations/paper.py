@@ -1,9 +1,9 @@
 """Paper operations."""
 
 from datetime import datetime
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, func, update
 
 from ..connection import SessionLocal
 from ..models import ArxivPaper, PaperAnalysis, ResearchTopic
@@ -36,6 +36,31 @@ async def create_arxiv_paper(data: dict[str, Any]) -> ArxivPaper:
         return paper
 
 
+async def get_or_create_arxiv_papers(
+    papers: List[dict[str, Any]],
+) -> Dict[str, ArxivPaper]:
+    """Fetch ArXiv papers by ArXiv ID, creating the missing ones in one transaction.
+
+    :param papers: Paper data dicts; each must contain ``arxiv_id``
+    :returns: Mapping of ArXiv ID to ArxivPaper instance
+    """
+    if not papers:
+        return {}
+    async with SessionLocal() as session:
+        arxiv_ids = {data["arxiv_id"] for data in papers}
+        result = await session.execute(
+            select(ArxivPaper).where(ArxivPaper.arxiv_id.in_(arxiv_ids))
+        )
+        by_arxiv_id = {paper.arxiv_id: paper for paper in result.scalars()}
+        for data in papers:
+            if data["arxiv_id"] not in by_arxiv_id:
+                paper = ArxivPaper(**data)
+                session.add(paper)
+                by_arxiv_id[paper.arxiv_id] = paper
+        await session.commit()
+        return by_arxiv_id
+
+
 async def has_paper_analysis(paper_id: int, topic_id: int) -> bool:
     """Check if paper analysis exists.
 
@@ -93,11 +118,31 @@ async def create_paper_analysis(
         return analysis
 
 
+async def create_paper_analyses(
+    analyses: List[dict[str, Any]],
+) -> List[PaperAnalysis]:
+    """Create several paper analyses in one transaction.
+
+    :param analyses: Analysis data dicts with the fields of :func:`create_paper_analysis`
+    :returns: PaperAnalysis instances in input order
+    """
+    if not analyses:
+        return []
+    async with SessionLocal() as session:
+        rows = [PaperAnalysis(**data) for data in analyses]
+        session.add_all(rows)
+        await session.commit()
+        return rows
+
+
 async def list_new_analyses_since(
     last_id: int, min_overall: float
 ) -> List[PaperAnalysis]:
     """List new analyses since last ID.
 
+    Only analyses still in the ``analyzed`` state are returned, so rows that
+    are already queued or notified never leave the database.
+
     :param last_id: Last analysis ID
     :param min_overall: Minimum relevance score
     :returns: List of PaperAnalysis instances
@@ -126,13 +171,17 @@ async def get_analysis_with_entities(
     :returns: Tuple of (PaperAnalysis, ArxivPaper, ResearchTopic) or None
     """
     async with SessionLocal() as session:
-        analysis = await session.get(PaperAnalysis, analysis_id)
-        if analysis is None:
-            return None
-        paper = await session.get(ArxivPaper, analysis.paper_id)
-        topic = await session.get(ResearchTopic, analysis.topic_id)
-        if paper is None or topic is None:
+        # Single round-trip; inner joins yield no row if either entity is missing
+        result = await session.execute(
+            select(PaperAnalysis, ArxivPaper, ResearchTopic)
+            .join(ArxivPaper, PaperAnalysis.paper_id == ArxivPaper.id)
+            .join(ResearchTopic, PaperAnalysis.topic_id == ResearchTopic.id)
+            .where(PaperAnalysis.id == analysis_id)
+        )
+        row = result.first()
+        if row is None:
             return None
+        analysis, paper, topic = row
         return analysis, paper, topic
 
 
@@ -141,13 +190,7 @@ async def mark_analysis_notified(analysis_id: int) -> None:
 
     :param analysis_id: Analysis ID
     """
-    async with SessionLocal() as session:
-        analysis = await session.get(PaperAnalysis, analysis_id)
-        if analysis is None:
-            return
-        analysis.status = "notified"
-        analysis.updated_at = datetime.now()
-        await session.commit()
+    await _set_analyses_status([analysis_id], "notified")
 
 
 async def mark_analysis_queued(analysis_id: int) -> None:
@@ -155,10 +198,45 @@ async def mark_analysis_queued(analysis_id: int) -> None:
 
     :param analysis_id: Analysis ID
     """
+    await _set_analyses_status([analysis_id], "queued")
+
+
+async def _set_analyses_status(analysis_ids: List[int], status: str) -> None:
+    """Set the status of several analyses with a single UPDATE statement.
+
+    :param analysis_ids: Analysis IDs
+    :param status: New analysis status
+    """
+    if not analysis_ids:
+        return
     async with SessionLocal() as session:
-        analysis = await session.get(PaperAnalysis, analysis_id)
-        if analysis is None:
-            return
-        analysis.status = "queued"
-        analysis.updated_at = datetime.now()
+        await session.execute(
+            update(PaperAnalysis)
+            .where(PaperAnalysis.id.in_(analysis_ids))
+            .values(status=status, updated_at=datetime.now())
+        )
         await session.commit()
+
+
+async def mark_analyses_notified_bulk(analysis_ids: List[int]) -> None:
+    """Mark several analyses as notified in one round-trip.
+
+    :param analysis_ids: Analysis IDs
+    """
+    await _set_analyses_status(analysis_ids, "notified")
+
+
+async def mark_analyses_queued_bulk(analysis_ids: List[int]) -> None:
+    """Mark several analyses as queued in one round-trip.
+
+    :param analysis_ids: Analysis IDs
+    """
+    await _set_analyses_status(analysis_ids, "queued")
+
+
+async def mark_analyses_analyzed_bulk(analysis_ids: List[int]) -> None:
+    """Return several analyses to the analyzed state, e.g. after a failed send.
+
+    :param analysis_ids: Analysis IDs
+    """
+    await _set_analyses_status(analysis_ids, "analyzed")
@@ -65,17 +65,18 @@ async def update_queue_positions() -> None:
 
         queue_entries = result.scalars().all()
 
+        # Same statistics and clock for every entry of this pass
+        stats = await get_or_create_task_statistics()
+        seconds_per_slot = stats.median_processing_time / max(stats.active_workers, 1)
+        now = datetime.now()
+
         for i, entry in enumerate(queue_entries, 1):
             entry.queue_position = i
             # Update estimated start time
-            stats = await get_or_create_task_statistics()
-            estimated_wait = (
-                stats.median_processing_time * (i - 1) / max(stats.active_workers, 1)
-            )
-            entry.estimated_start_time = datetime.now() + timedelta(
-                seconds=estimated_wait
+            entry.estimated_start_time = now + timedelta(
+                seconds=seconds_per_slot * (i - 1)
             )
-            entry.updated_at = datetime.now()
+            entry.updated_at = now
 
         await session.commit()
 
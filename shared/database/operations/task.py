@@ -1,9 +1,9 @@
 """Task management operations."""
 
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select, and_
+from sqlalchemy import func, select, and_, update
 from sqlalchemy.orm import selectinload
 
 from ..connection import SessionLocal
@@ -41,12 +41,26 @@ async def create_user_task_with_queue(
         # Add to queue
         queue_entry = await add_task_to_queue(task)
 
-        # Increment user's daily counter
-        user.daily_tasks_created += 1
-        user.updated_at = datetime.now()
-        await session.merge(user)
+        # Increment user's daily counter in SQL; merging the passed instance
+        # would write back whatever stale fields it carries
+        await session.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(
+                daily_tasks_created=User.daily_tasks_created + 1,
+                updated_at=datetime.now(),
+            )
+        )
         await session.commit()
 
+        fresh_user = await session.get(User, user.id)
+        if fresh_user is not None:
+            from .user import _cache_user
+
+            user.daily_tasks_created = fresh_user.daily_tasks_created
+            user.updated_at = fresh_user.updated_at
+            _cache_user(fresh_user)
+
         return task, queue_entry
 
 
@@ -66,6 +80,76 @@ async def get_user_tasks(user_id: int) -> List[UserTask]:
         return list(result.scalars().all())
 
 
+async def get_user_task(user_id: int, task_id: int) -> Optional[UserTask]:
+    """Get a single task if it is owned by the user.
+
+    :param user_id: Internal user ID
+    :param task_id: Task ID
+    :returns: UserTask instance or None if missing or owned by another user
+    """
+    async with SessionLocal() as session:
+        result = await session.execute(
+            select(UserTask).where(
+                and_(UserTask.id == task_id, UserTask.user_id == user_id)
+            )
+        )
+        return result.scalar_one_or_none()
+
+
+async def list_recent_user_tasks(
+    user_id: int, statuses: Sequence[TaskStatus], limit: int
+) -> List[UserTask]:
+    """List the most recently updated user tasks in the given statuses.
+
+    :param user_id: Internal user ID
+    :param statuses: Statuses to include
+    :param limit: Maximum number of tasks to return
+    :returns: List of UserTask instances, newest update first
+    """
+    async with SessionLocal() as session:
+        result = await session.execute(
+            select(UserTask)
+            .options(selectinload(UserTask.queue_entry))
+            .where(and_(UserTask.user_id == user_id, UserTask.status.in_(statuses)))
+            .order_by(UserTask.updated_at.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+
+async def count_user_tasks_by_status(user_id: int) -> Dict[TaskStatus, int]:
+    """Count a user's tasks per status with a single grouped query.
+
+    :param user_id: Internal user ID
+    :returns: Mapping of status to task count; statuses without tasks are omitted
+    """
+    async with SessionLocal() as session:
+        result = await session.execute(
+            select(UserTask.status, func.count())
+            .where(UserTask.user_id == user_id)
+            .group_by(UserTask.status)
+        )
+        return {TaskStatus(status): count for status, count in result.all()}
+
+
+async def count_user_active_tasks(user_id: int) -> int:
+    """Count the user's queued and processing tasks.
+
+    :param user_id: Internal user ID
+    :returns: Number of tasks occupying a concurrent slot
+    """
+    async with SessionLocal() as session:
+        result = await session.execute(
+            select(func.count(UserTask.id)).where(
+                and_(
+                    UserTask.user_id == user_id,
+                    UserTask.status.in_([TaskStatus.QUEUED, TaskStatus.PROCESSING]),
+                )
+            )
+        )
+        return int(result.scalar_one() or 0)
+
+
 async def update_user_task_status(task_id: int, status: TaskStatus) -> None:
     """Update task status.
 
@@ -73,11 +157,11 @@ async def update_user_task_status(task_id: int, status: TaskStatus) -> None:
     :param status: New status
     """
     async with SessionLocal() as session:
-        task = await session.get(UserTask, task_id)
-        if task is None:
-            return
-        task.status = status
-        task.updated_at = datetime.now()
+        await session.execute(
+            update(UserTask)
+            .where(UserTask.id == task_id)
+            .values(status=status, updated_at=datetime.now())
+        )
         await session.commit()
 
 
@@ -89,16 +173,16 @@ async def update_user_task_status_for_user(
     :param user_id: Internal user ID
     :param task_id: Task ID
     :param status: New status
-    :returns: True if updated successfully, False if user not found
+    :returns: True if updated successfully, False if the task is not owned by user
     """
     async with SessionLocal() as session:
-        task = await session.get(UserTask, task_id)
-        if task is None or task.user_id != user_id:
-            return False
-        task.status = status
-        task.updated_at = datetime.now()
+        result = await session.execute(
+            update(UserTask)
+            .where(and_(UserTask.id == task_id, UserTask.user_id == user_id))
+            .values(status=status, updated_at=datetime.now())
+        )
         await session.commit()
-        return True
+        return result.rowcount > 0
 
 
 async def deactivate_user_tasks(user_id: int) -> None:
@@ -1,13 +1,46 @@
 """User management operations."""
 
+import os
+import time
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select
 
 from ..connection import SessionLocal
-from ..models import User, UserTask
-from ..enums import UserPlan, TaskStatus
+from ..models import User
+from ..enums import UserPlan
+from .task import count_user_active_tasks
+
+# In-process cache of users by telegram_id: telegram_id -> (user, stored at).
+# Every handler resolves the user first; user rows are only written by this
+# module and create_user_task_with_queue, which re-caches the row it wrote.
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL", "30"))
+_user_cache: Dict[int, Tuple[User, float]] = {}
+
+
+def _get_cached_user(telegram_id: int) -> Optional[User]:
+    """Look up a user in the in-process cache.
+
+    :param telegram_id: Telegram user ID
+    :returns: Cached User instance or None on a miss or expired entry
+    """
+    if USER_CACHE_TTL_SECONDS <= 0:
+        return None
+    entry = _user_cache.get(telegram_id)
+    if entry is None or time.monotonic() - entry[1] > USER_CACHE_TTL_SECONDS:
+        return None
+    return entry[0]
+
+
+def _cache_user(user: User) -> None:
+    """Store a user in the in-process cache.
+
+    :param user: User instance
+    """
+    if USER_CACHE_TTL_SECONDS <= 0:
+        return
+    _user_cache[user.telegram_id] = (user, time.monotonic())
 
 
 async def get_or_create_user(
@@ -24,6 +57,14 @@ async def get_or_create_user(
     :param last_name: User's last name (optional)
     :returns: User instance
     """
+    cached = _get_cached_user(telegram_id)
+    if cached is not None and (
+        (not username or cached.username == username)
+        and (not first_name or cached.first_name == first_name)
+        and (not last_name or cached.last_name == last_name)
+    ):
+        return cached
+
     async with SessionLocal() as session:
         result = await session.execute(
             select(User).where(User.telegram_id == telegram_id)
@@ -65,7 +106,8 @@ async def get_or_create_user(
                 await session.commit()
                 await session.refresh(user)
 
-        return user
+    _cache_user(user)
+    return user
 
 
 async def upgrade_user_plan(
@@ -78,6 +120,7 @@ async def upgrade_user_plan(
     :param expires_at: Plan expiration date (for premium)
     :returns: True if upgraded successfully, False if user not found
     """
+    _user_cache.pop(telegram_id, None)
     async with SessionLocal() as session:
         result = await session.execute(
             select(User).where(User.telegram_id == telegram_id)
@@ -120,6 +163,12 @@ async def reset_daily_counters_if_needed(user: User) -> User:
                 fresh_user.updated_at = now
                 await session.commit()
                 await session.refresh(fresh_user)
+                # Callers keep using the instance they passed in, so it must
+                # not carry the pre-reset counter into later writes
+                user.daily_tasks_created = fresh_user.daily_tasks_created
+                user.last_daily_reset = fresh_user.last_daily_reset
+                user.updated_at = fresh_user.updated_at
+                _cache_user(fresh_user)
                 return fresh_user
     return user
 
@@ -149,21 +198,11 @@ async def check_user_can_create_task(user: User) -> Tuple[bool, str]:
         return False, f"Daily task limit reached ({user.daily_task_limit})"
 
     # Check concurrent tasks
-    async with SessionLocal() as session:
-        active_count = await session.execute(
-            select(func.count(UserTask.id)).where(
-                and_(
-                    UserTask.user_id == user.id,
-                    UserTask.status.in_([TaskStatus.QUEUED, TaskStatus.PROCESSING]),
-                )
-            )
+    active_tasks = await count_user_active_tasks(user.id)
+    if active_tasks >= user.concurrent_task_limit:
+        return (
+            False,
+            f"Concurrent task limit reached ({user.concurrent_task_limit})",
         )
-        active_tasks = active_count.scalar_one() or 0
-
-        if active_tasks >= user.concurrent_task_limit:
-            return (
-                False,
-                f"Concurrent task limit reached ({user.concurrent_task_limit})",
-            )
 
     return True, "OK"
@@ -10,6 +10,8 @@ from shared.database import (
     engine,
     SessionLocal,
     init_db,
+    optimize_db,
+    close_db,
     ensure_connection,
     UserPlan,
     TaskStatus,
@@ -26,6 +28,7 @@ from shared.database import (
     PaperAnalysis,
     UserSettings,
     AgentStatus,
+    NotificationCursor,
     get_or_create_user,
     upgrade_user_plan,
     reset_daily_counters_if_needed,
@@ -37,6 +40,10 @@ from shared.database import (
     create_user_task_with_queue,
     create_user_task,
     get_user_tasks,
+    get_user_task,
+    list_recent_user_tasks,
+    count_user_tasks_by_status,
+    count_user_active_tasks,
     update_user_task_status,
     update_user_task_status_for_user,
     deactivate_user_tasks,
@@ -52,13 +59,18 @@ from shared.database import (
     list_active_topics,
     get_topic_by_user_and_text,
     create_arxiv_paper,
+    get_or_create_arxiv_papers,
     get_arxiv_paper_by_arxiv_id,
     create_paper_analysis,
+    create_paper_analyses,
     has_paper_analysis,
     list_new_analyses_since,
     get_analysis_with_entities,
     mark_analysis_notified,
     mark_analysis_queued,
+    mark_analyses_notified_bulk,
+    mark_analyses_queued_bulk,
+    mark_analyses_analyzed_bulk,
     list_recent_analyses_for_user,
     update_agent_status,
     get_agent_status,
@@ -67,6 +79,7 @@ from shared.database import (
     complete_task_processing,
     create_research_topic_for_user_task,
     link_analysis_to_user_task,
+    link_analyses_to_user_task,
     get_user_task_results,
     create_task,
     list_pending_tasks,
@@ -74,6 +87,7 @@ from shared.database import (
     mark_task_failed,
     list_completed_tasks_since,
     mark_task_sent,
+    mark_tasks_sent_bulk,
     get_task,
     list_active_queries_for_task,
     create_search_query,
@@ -84,6 +98,8 @@ from shared.database import (
     count_relevant_analyses_for_user,
     swap_user_active_topics,
     deactivate_user_topics,
+    get_notification_cursor,
+    save_notification_cursor,
 )
 
 # Legacy aliases for backward compatibility
@@ -99,6 +115,8 @@ __all__ = [
     "session_factory",  # Legacy alias
     "init_db",
     "initialize_database",  # Legacy alias
+    "optimize_db",
+    "close_db",
     "ensure_connection",
     # Enums
     "UserPlan",
@@ -117,6 +135,7 @@ __all__ = [
     "PaperAnalysis",
     "UserSettings",
     "AgentStatus",
+    "NotificationCursor",
     # Operations
     "get_or_create_user",
     "upgrade_user_plan",
@@ -129,6 +148,10 @@ __all__ = [
     "create_user_task_with_queue",
     "create_user_task",  # Legacy wrapper
     "get_user_tasks",
+    "get_user_task",
+    "list_recent_user_tasks",
+    "count_user_tasks_by_status",
+    "count_user_active_tasks",
     "update_user_task_status",
     "update_user_task_status_for_user",
     "deactivate_user_tasks",
@@ -144,13 +167,18 @@ __all__ = [
     "list_active_topics",
     "get_topic_by_user_and_text",
     "create_arxiv_paper",
+    "get_or_create_arxiv_papers",
     "get_arxiv_paper_by_arxiv_id",
     "create_paper_analysis",
+    "create_paper_analyses",
     "has_paper_analysis",
     "list_new_analyses_since",
     "get_analysis_with_entities",
     "mark_analysis_notified",
     "mark_analysis_queued",
+    "mark_analyses_notified_bulk",
+    "mark_analyses_queued_bulk",
+    "mark_analyses_analyzed_bulk",
     "list_recent_analyses_for_user",
     "update_agent_status",
     "get_agent_status",
@@ -164,6 +192,7 @@ __all__ = [
     "mark_task_failed",
     "list_completed_tasks_since",
     "mark_task_sent",
+    "mark_tasks_sent_bulk",
     "get_task",
     "list_active_queries_for_task",
     "create_search_query",
@@ -176,5 +205,9 @@ __all__ = [
     "complete_task_processing",
     "create_research_topic_for_user_task",
     "link_analysis_to_user_task",
+    "link_analyses_to_user_task",
     "get_user_task_results",
+    # Notification cursor functions
+    "get_notification_cursor",
+    "save_notification_cursor",
 ]
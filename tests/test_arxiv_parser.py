@@ -0,0 +1,181 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+
+import PyPDF2
+
+from shared import arxiv_parser
+from shared.arxiv_parser import ArxivPaper, ArxivParser
+
+
+def _paper(paper_id: str) -> ArxivPaper:
+    now = datetime.now()
+    return ArxivPaper(
+        id=paper_id,
+        title=f"Paper {paper_id}",
+        authors=[],
+        summary="",
+        categories=[],
+        published=now,
+        updated=now,
+        pdf_url=f"https://arxiv.org/pdf/{paper_id}",
+        abs_url=f"https://arxiv.org/abs/{paper_id}",
+    )
+
+
+class FakeResponse:
+    def __init__(self, url: str) -> None:
+        self.url = url
+
+    def __enter__(self) -> "FakeResponse":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        if self.url.endswith("bad"):
+            raise RuntimeError("http error")
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        yield self.url.encode()
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.urls: List[str] = []
+
+    def get(self, url: str, **_: Any) -> FakeResponse:
+        self.urls.append(url)
+        return FakeResponse(url)
+
+
+def test_download_pdfs_uses_shared_session(tmp_path: Path) -> None:
+    parser = ArxivParser(downloads_dir=str(tmp_path))
+    session = FakeSession()
+    parser.session = session  # type: ignore[assignment]
+
+    papers = [_paper("1"), _paper("2"), _paper("bad")]
+    results = {paper.id: path for paper, path in parser.download_pdfs(papers)}
+
+    assert sorted(session.urls) == sorted(p.pdf_url for p in papers)
+    assert results["bad"] is None
+    assert Path(results["1"] or "").read_bytes() == b"https://arxiv.org/pdf/1"
+    assert Path(results["2"] or "").exists()
+
+
+def test_aget_paper_texts_keeps_input_order(tmp_path: Path) -> None:
+    parser = ArxivParser(downloads_dir=str(tmp_path))
+
+    def fake_text(paper: ArxivPaper) -> Optional[str]:
+        time.sleep(0.01 if paper.id == "1" else 0)
+        return None if paper.id == "bad" else f"text {paper.id}"
+
+    parser.get_paper_text_online = fake_text  # type: ignore[method-assign]
+    papers = [_paper("1"), _paper("bad"), _paper("2")]
+
+    texts = asyncio.run(parser.aget_paper_texts(papers, max_concurrency=2))
+
+    assert texts == ["text 1", None, "text 2"]
+
+
+def test_search_papers_reuses_cached_results(tmp_path: Path, monkeypatch: Any) -> None:
+    monkeypatch.setattr(arxiv_parser, "_metadata_cache", {})
+    parser = ArxivParser(downloads_dir=str(tmp_path))
+    calls: List[Any] = []
+
+    class FakeClient:
+        def results(self, search: Any, offset: int = 0) -> Iterator[Any]:
+            calls.append((search, offset))
+            return iter([])
+
+    parser.client = FakeClient()  # type: ignore[assignment]
+
+    assert parser.search_papers("rag", max_results=5) == []
+    assert parser.search_papers("rag", max_results=5) == []
+    assert parser.search_papers("rag", max_results=6) == []
+    assert len(calls) == 2
+
+    # Pages are requested from the API instead of skipped client-side
+    parser.search_papers("rag", max_results=5, start=10)
+    search, offset = calls[-1]
+    assert (search.max_results, offset) == (15, 10)
+
+    # Date filters only reach the query at day granularity
+    day = datetime(2024, 5, 1, 8, 0)
+    parser.search_papers("rag", date_from=day)
+    parser.search_papers("rag", date_from=day.replace(hour=17))
+    assert len(calls) == 4
+
+    # Polling callers always reach the API
+    parser.search_papers("rag", max_results=5, use_cache=False)
+    assert len(calls) == 5
+
+
+def test_extract_text_from_pdf_caches_by_content(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    parser = ArxivParser(downloads_dir=str(tmp_path))
+    writer = PyPDF2.PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    pdf_path = tmp_path / "paper.pdf"
+    with open(pdf_path, "wb") as f:
+        writer.write(f)
+
+    assert parser.extract_text_from_pdf(str(pdf_path)) == ""
+    assert len(list(parser.text_cache_dir.glob("*.txt"))) == 1
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("PDF parsed again")
+
+    monkeypatch.setattr(arxiv_parser.PyPDF2, "PdfReader", fail)
+    copy_path = tmp_path / "copy.pdf"
+    copy_path.write_bytes(pdf_path.read_bytes())
+    assert parser.extract_text_from_pdf(str(copy_path)) == ""
+
+
+def test_extract_html_main_text(tmp_path: Path) -> None:
+    parser = ArxivParser(downloads_dir=str(tmp_path))
+    page = (
+        b"<html><body><nav>Menu</nav>"
+        b"<div class='ltx_page_content main'><p>Deep <b>learning</b> </p>"
+        b"<style>.x{}</style><p>works</p></div></body></html>"
+    )
+
+    assert parser._extract_html_main_text(page) == "Deeplearningworks"
+    assert parser._extract_html_main_text(b"<p>No content</p>") is None
+    assert parser._extract_html_main_text(b"") is None
+
+
+def test_metadata_cache_eviction_is_thread_safe(monkeypatch: Any) -> None:
+    monkeypatch.setattr(arxiv_parser, "_metadata_cache", {})
+    monkeypatch.setattr(arxiv_parser, "ARXIV_CACHE_MAX_ENTRIES", 8)
+
+    def fill(worker: int) -> None:
+        for i in range(2000):
+            arxiv_parser._cache_metadata(("key", worker, i), i, 60)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(fill, range(8)))
+
+    assert len(arxiv_parser._metadata_cache) <= 8
+
+
+def test_text_cache_evicts_least_recently_used(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(arxiv_parser, "ARXIV_TEXT_CACHE_MAX_FILES", 2)
+    parser = ArxivParser(downloads_dir=str(tmp_path))
+    parser._write_text_cache("a", "text a")
+    parser._write_text_cache("b", "text b")
+    # Age both entries, then read "a" so that "b" is the least recently used
+    for name in ("a", "b"):
+        path = parser.text_cache_dir / f"{name}.txt"
+        arxiv_parser.os.utime(path, (time.time() - 60, time.time() - 60))
+    assert parser._read_text_cache("a") == "text a"
+
+    parser._write_text_cache("c", "text c")
+    assert sorted(p.stem for p in parser.text_cache_dir.glob("*.txt")) == ["a", "c"]
@@ -0,0 +1,239 @@
+import asyncio
+from typing import Any, List
+
+import bot.handlers.notifications.service as service_mod
+
+
+def test_simplify_for_layperson_shares_inflight_calls(monkeypatch: Any) -> None:
+    calls: List[str] = []
+
+    async def fake_run(text: str) -> str:
+        calls.append(text)
+        await asyncio.sleep(0.01)
+        return text.upper()
+
+    monkeypatch.setattr(service_mod, "_run_simplifier", fake_run)
+
+    async def run() -> List[str]:
+        return list(
+            await asyncio.gather(
+                service_mod.simplify_for_layperson("facts"),
+                service_mod.simplify_for_layperson("facts"),
+                service_mod.simplify_for_layperson("other"),
+            )
+        )
+
+    assert asyncio.run(run()) == ["FACTS", "FACTS", "OTHER"]
+    assert sorted(calls) == ["facts", "other"]
+    assert service_mod._inflight_simplifications == {}
+
+
+def test_parse_set_notification() -> None:
+    from bot.handlers.notifications.handlers import _parse_set_notification
+
+    assert _parse_set_notification("Instant 80") == ("instant", 80.0)
+    assert _parse_set_notification("daily 12.5") == ("daily", 12.5)
+    assert _parse_set_notification(None) is None
+    assert _parse_set_notification("daily") is None
+    assert _parse_set_notification("daily high") is None
+    assert _parse_set_notification("daily 1 2") is None
+
+
+def test_apply_setting_skips_unchanged_value(monkeypatch: Any) -> None:
+    import bot.handlers.notifications.handlers as handlers_mod
+
+    class FakeSettings:
+        group_chat_id = None
+
+    class FakeMessage:
+        def __init__(self) -> None:
+            self.replies: List[str] = []
+
+        async def answer(self, text: str, **_: Any) -> None:
+            self.replies.append(text)
+
+    updates: List[Any] = []
+
+    async def fake_get(user_id: int) -> FakeSettings:
+        return FakeSettings()
+
+    async def fake_update(user_id: int, **fields: Any) -> None:
+        updates.append(fields)
+
+    async def fake_simplify(text: str) -> str:
+        return text
+
+    monkeypatch.setattr(handlers_mod, "get_user_settings", fake_get)
+    monkeypatch.setattr(handlers_mod, "update_user_settings", fake_update)
+    monkeypatch.setattr(handlers_mod, "simplify_for_layperson", fake_simplify)
+
+    async def run(value: Any) -> List[str]:
+        message = FakeMessage()
+        await handlers_mod._apply_setting(
+            message,  # type: ignore[arg-type]
+            "set_group",
+            1,
+            "group_chat_id",
+            value,
+            headline="saved",
+            explanation="why",
+            unchanged_msg="unchanged",
+        )
+        return message.replies
+
+    assert asyncio.run(run(None)) == ["unchanged"]
+    assert updates == []
+    assert asyncio.run(run(-100)) == ["saved\nwhy"]
+    assert updates == [{"group_chat_id": -100}]
+
+
+def test_notification_pollers_follow_schedule(monkeypatch: Any) -> None:
+    calls: List[tuple[str, int]] = []
+
+    async def fake_cursor(name: str) -> int:
+        return {"fast": 5, "slow": 7}[name]
+
+    async def fast(bot: Any, last_id: int) -> int:
+        calls.append(("fast", last_id))
+        return last_id + 1
+
+    async def slow(bot: Any, last_id: int) -> int:
+        calls.append(("slow", last_id))
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(service_mod, "get_notification_cursor", fake_cursor)
+    monkeypatch.setattr(
+        service_mod,
+        "_POLL_JOBS",
+        (
+            ("fast", "fast", fast, 0.01, 0.01, 0.01),
+            ("slow", "slow", slow, 0.01, 0.01, 0.035),
+        ),
+    )
+    monkeypatch.setattr(service_mod, "_POLL_JITTER_SECONDS", 0.0)
+
+    async def run() -> None:
+        poller = asyncio.create_task(service_mod.run_notification_pollers(None))  # type: ignore[arg-type]
+        await asyncio.sleep(0.1)
+        poller.cancel()
+
+    asyncio.run(run())
+    fast_ids = [last_id for name, last_id in calls if name == "fast"]
+    slow_ids = [last_id for name, last_id in calls if name == "slow"]
+    assert calls[0] == ("fast", 5)
+    assert fast_ids == list(range(5, 5 + len(fast_ids))) and len(fast_ids) >= 3
+    # A failing round keeps its cursor and is retried after the longer delay
+    assert slow_ids[:2] == [7, 7] and len(slow_ids) < len(fast_ids)
+
+
+def test_blocked_poll_round_does_not_delay_other_jobs(monkeypatch: Any) -> None:
+    calls: List[str] = []
+    release = asyncio.Event()
+
+    async def fake_cursor(name: str) -> int:
+        return 0
+
+    async def fast(bot: Any, last_id: int) -> int:
+        calls.append("fast")
+        return last_id
+
+    async def blocked(bot: Any, last_id: int) -> int:
+        calls.append("blocked")
+        await release.wait()
+        return last_id
+
+    monkeypatch.setattr(service_mod, "get_notification_cursor", fake_cursor)
+    monkeypatch.setattr(
+        service_mod,
+        "_POLL_JOBS",
+        (
+            ("blocked", "blocked", blocked, 0.01, 0.01, 0.01),
+            ("fast", "fast", fast, 0.01, 0.01, 0.01),
+        ),
+    )
+    monkeypatch.setattr(service_mod, "_POLL_JITTER_SECONDS", 0.0)
+
+    async def run() -> None:
+        poller = asyncio.create_task(service_mod.run_notification_pollers(None))  # type: ignore[arg-type]
+        await asyncio.sleep(0.1)
+        poller.cancel()
+        try:
+            await poller
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(run())
+    # The blocked round never overlaps itself while the other job keeps firing
+    assert calls.count("blocked") == 1
+    assert calls.count("fast") >= 3
+
+
+def test_completed_task_cursor_stops_at_first_failed_delivery(
+    monkeypatch: Any,
+) -> None:
+    saved: List[int] = []
+    marked: List[List[int]] = []
+    tasks = [type("Task", (), {"id": task_id})() for task_id in (3, 4, 5)]
+
+    async def fake_list(last_id: int) -> List[Any]:
+        return [task for task in tasks if task.id > last_id]
+
+    async def fake_process(bot: Any, task: Any, mark_sent: bool = True) -> bool:
+        return task.id != 4
+
+    async def fake_mark(task_ids: List[int]) -> None:
+        marked.append(task_ids)
+
+    async def fake_save(name: str, value: int) -> None:
+        saved.append(value)
+
+    monkeypatch.setattr(service_mod, "list_completed_tasks_since", fake_list)
+    monkeypatch.setattr(service_mod, "process_completed_task", fake_process)
+    monkeypatch.setattr(service_mod, "mark_tasks_sent_bulk", fake_mark)
+    monkeypatch.setattr(service_mod, "save_notification_cursor", fake_save)
+
+    cursor = asyncio.run(service_mod._poll_completed_tasks(None, 0))  # type: ignore[arg-type]
+    # Task 4 failed: the saved cursor stays before it so it is retried
+    assert cursor == 3 and saved == [3]
+    assert marked == [[3, 5]]
+
+
+def test_failed_analysis_send_is_released_for_retry(monkeypatch: Any) -> None:
+    statuses: dict[int, str] = {}
+    saved: List[int] = []
+    analyses = [type("Analysis", (), {"id": i, "relevance": 90.0})() for i in (1, 2, 3)]
+    topic = type("Topic", (), {"user_id": 7})()
+
+    async def fake_list(last_id: int, min_overall: float) -> List[Any]:
+        return [a for a in analyses if a.id > last_id]
+
+    async def fake_entities(analysis_id: int) -> Any:
+        return analyses[analysis_id - 1], None, topic
+
+    async def fake_settings(user_id: int) -> None:
+        return None
+
+    async def fake_send(bot: Any, user_id: int, analysis_id: int, **_: Any) -> bool:
+        return analysis_id != 2
+
+    def setter(status: str) -> Any:
+        async def mark(ids: List[int]) -> None:
+            statuses.update({i: status for i in ids})
+
+        return mark
+
+    async def fake_save(name: str, value: int) -> None:
+        saved.append(value)
+
+    monkeypatch.setattr(service_mod, "list_new_analyses_since", fake_list)
+    monkeypatch.setattr(service_mod, "get_analysis_with_entities", fake_entities)
+    monkeypatch.setattr(service_mod, "get_user_settings", fake_settings)
+    monkeypatch.setattr(service_mod, "send_analysis_report", fake_send)
+    monkeypatch.setattr(service_mod, "mark_analyses_queued_bulk", setter("queued"))
+    monkeypatch.setattr(service_mod, "mark_analyses_notified_bulk", setter("notified"))
+    monkeypatch.setattr(service_mod, "mark_analyses_analyzed_bulk", setter("analyzed"))
+    monkeypatch.setattr(service_mod, "save_notification_cursor", fake_save)
+
+    cursor = asyncio.run(service_mod._poll_new_analyses(None, 0))  # type: ignore[arg-type]
+    assert cursor == 1 and saved == [1]
+    assert statuses == {1: "notified", 2: "analyzed", 3: "notified"}
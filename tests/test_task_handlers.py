@@ -0,0 +1,38 @@
+import asyncio
+from typing import Any, List
+
+import bot.handlers.task as task_mod
+
+
+def test_queue_refresh_requests_are_coalesced(monkeypatch: Any) -> None:
+    calls: List[int] = []
+
+    async def fake_update() -> None:
+        calls.append(1)
+
+    monkeypatch.setattr(task_mod, "update_queue_positions", fake_update)
+    monkeypatch.setattr(task_mod, "QUEUE_REFRESH_INTERVAL_SECONDS", 0.05)
+    monkeypatch.setattr(task_mod, "_queue_refresh_requested", asyncio.Event())
+    monkeypatch.setattr(task_mod, "_queue_refresh_worker", None)
+
+    async def run() -> None:
+        for _ in range(5):
+            task_mod.request_queue_refresh()
+        await asyncio.sleep(0.01)
+        assert len(calls) == 1
+
+        task_mod.request_queue_refresh()
+        task_mod.request_queue_refresh()
+        await asyncio.sleep(0.1)
+        assert len(calls) == 2
+        task_mod._queue_refresh_worker.cancel()
+
+    asyncio.run(run())
+
+
+def test_parse_callback_task_id() -> None:
+    assert task_mod._parse_callback_task_id("history_task_42") == 42
+    assert task_mod._parse_callback_task_id("history_task_") is None
+    assert task_mod._parse_callback_task_id("history_task_-1") is None
+    assert task_mod._parse_callback_task_id("history_task_" + "9" * 11) is None
+    assert task_mod._parse_callback_task_id(None) is None